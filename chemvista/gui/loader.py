@@ -0,0 +1,42 @@
+"""Background file loading for ChemVista GUI"""
+import logging
+import pathlib
+from typing import Union
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from nx_ase import Trajectory
+
+logger = logging.getLogger("chemvista.gui.loader")
+
+
+class XyzLoadSignals(QObject):
+    """Signals emitted by XyzLoadWorker
+
+    The signals object is created on the GUI thread, so connected slots are
+    invoked there through queued connections.
+    """
+    finished = pyqtSignal(object, object)  # filepath, trajectory
+    failed = pyqtSignal(object, str)  # filepath, error message
+
+
+class XyzLoadWorker(QRunnable):
+    """Parse an XYZ file on a thread pool worker
+
+    Only the parsing happens here; building the scene objects is left to the
+    receiver of the finished signal, which runs on the GUI thread.
+    """
+
+    def __init__(self, filepath: Union[str, pathlib.Path]):
+        super().__init__()
+        self.filepath = pathlib.Path(filepath)
+        self.signals = XyzLoadSignals()
+
+    def run(self):
+        logger.info(f"Parsing {self.filepath} in background")
+        try:
+            trajectory = Trajectory.load(self.filepath)
+        except Exception as e:
+            logger.error(f"Failed to parse {self.filepath}: {e}")
+            self.signals.failed.emit(self.filepath, str(e))
+            return
+        self.signals.finished.emit(self.filepath, trajectory)
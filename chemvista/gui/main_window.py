@@ -1,13 +1,14 @@
 import pathlib
 from typing import Dict, List, Optional
 
-from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtCore import QObject, Qt, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import (QAction, QDialog, QDockWidget, QFileDialog,
                              QMainWindow, QMessageBox, QToolBar, QColorDialog,
                              QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QCheckBox, QPushButton)
 
 from ..scene_manager import SceneManager
 from ..tree_structure import TreeSignals
+from .loader import XyzLoadWorker
 from .scene import SceneWidget, SceneWidgetSignals
 from .widgets.object_tree import ObjectTreeWidget, TreeWidgetSignals
 import logging
@@ -26,6 +27,8 @@ class ChemVistaApp(QMainWindow):
         self.scene_widget_signals = SceneWidgetSignals()
         self.tree_signals = TreeSignals()
         self.tree_widget_signals = TreeWidgetSignals()
+        # Background loads are kept referenced until they report back
+        self._pending_loads: List[XyzLoadWorker] = []
         # Use provided scene manager or create new one
         if scene_manager is None:
             logger.info("Creating new scene manager")
@@ -62,17 +65,19 @@ class ChemVistaApp(QMainWindow):
     def load_initial_files(self, init_files: Dict[str, List[pathlib.Path]]):
         """Load files specified in initialization dictionary"""
         try:
-            # Load XYZ files
-            for xyz_file in init_files.get('xyz_files', []):
-                self.scene_manager.load_xyz(xyz_file)
+            # Announce all loaded objects to the tree at once
+            with self.scene_manager.bulk_update():
+                # Load XYZ files
+                for xyz_file in init_files.get('xyz_files', []):
+                    self.scene_manager.load_xyz(xyz_file)
 
-            # Load cube files as molecules with fields
-            for cube_file in init_files.get('cube_mol_files', []):
-                self.scene_manager.load_molecule_from_cube(cube_file)
+                # Load cube files as molecules with fields
+                for cube_file in init_files.get('cube_mol_files', []):
+                    self.scene_manager.load_molecule_from_cube(cube_file)
 
-            # Load cube files as scalar fields
-            for cube_file in init_files.get('cube_field_files', []):
-                self.scene_manager.load_scalar_field_from_cube(cube_file)
+                # Load cube files as scalar fields
+                for cube_file in init_files.get('cube_field_files', []):
+                    self.scene_manager.load_scalar_field_from_cube(cube_file)
 
             # Refresh view after loading all files
             if any(len(files) > 0 for files in init_files.values()):
@@ -173,15 +178,47 @@ class ChemVistaApp(QMainWindow):
                     else:
                         self.scene_manager.load_scalar_field_from_cube(
                             filepath)
+                    self.refresh_view()
                 else:
-                    self.scene_manager.load_xyz(filepath)
+                    # Parsing large trajectories can take a while, so keep
+                    # the event loop responsive while the file is read
+                    self.load_xyz_async(filepath)
 
-                self.refresh_view()
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Error", f"Failed to load file: {str(e)}")
 
+    def load_xyz_async(self, filepath: pathlib.Path):
+        """Parse an XYZ file on the thread pool and add it when done"""
+        worker = XyzLoadWorker(filepath)
+        worker.signals.finished.connect(self._on_xyz_loaded)
+        worker.signals.failed.connect(self._on_xyz_load_failed)
+        self._pending_loads.append(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def _release_load(self, filepath: pathlib.Path):
+        """Drop the reference to the finished worker for filepath"""
+        for i, worker in enumerate(self._pending_loads):
+            if worker.filepath == filepath:
+                del self._pending_loads[i]
+                break
+
+    def _on_xyz_loaded(self, filepath: pathlib.Path, trajectory):
+        """Create scene objects for a parsed XYZ file on the GUI thread"""
+        self._release_load(filepath)
+        try:
+            self.scene_manager.add_xyz_data(trajectory, filepath)
+            self.refresh_view()
         except Exception as e:
             QMessageBox.critical(
                 self, "Error", f"Failed to load file: {str(e)}")
 
+    def _on_xyz_load_failed(self, filepath: pathlib.Path, message: str):
+        """Report a background load error"""
+        self._release_load(filepath)
+        QMessageBox.critical(
+            self, "Error", f"Failed to load file: {message}")
+
     def on_screenshot(self):
         """Save a screenshot of the current view"""
         try:
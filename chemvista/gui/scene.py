@@ -3,7 +3,7 @@ import json
 import logging
 from typing import Optional
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QFrame, QVBoxLayout, QWidget, QApplication, QMessageBox
 from pyvistaqt import QtInteractor
 
@@ -46,6 +46,8 @@ class SceneWidget(QWidget):
 
         # Setup the UI
         self.setup_ui()
+        # Whether a coalesced refresh is already queued
+        self._refresh_pending = False
         # Initialize signals
         self._scene_signals = None
         self._tree_signals = None
@@ -113,13 +115,13 @@ class SceneWidget(QWidget):
             camera = self.plotter.camera
             logger.info("Refreshing view")
             logger.debug(f'Camera position: {camera.position}')
-            self.plotter.clear()
-            self.scene_manager.render(self.plotter)
+            # Keep the actors of unchanged objects instead of clearing
+            self.scene_manager.render(self.plotter, reuse_actors=True)
             self.plotter.update()
             self.plotter.camera = camera
             self.scene_signals.view_updated.emit()
-        except Exception as e:
-            import logging
+        except Exception:
+            logger.exception("Failed to refresh view")
 
     def reset_camera(self):
         """Reset the camera to show all objects"""
@@ -140,8 +142,15 @@ class SceneWidget(QWidget):
     def _on_render_changed(self, uuid):
         """Handle render changes from the scene manager"""
         logger.info(
-            f"Render changed for {uuid} - refreshing view")
-        # Refresh the view when rendering needs to be updated
+            f"Render changed for {uuid} - scheduling refresh")
+        # Coalesce all render changes from one event loop turn into a single refresh
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run the refresh scheduled by _on_render_changed"""
+        self._refresh_pending = False
         self.refresh_view()
 
     def take_screenshot(self, filename=None):
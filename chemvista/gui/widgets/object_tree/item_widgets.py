@@ -1,8 +1,9 @@
+import functools
 import logging
 import pathlib
 
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QPixmap
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QPushButton, QWidget
 
 from ....scene_objects import (MoleculeObject, ScalarFieldObject,
@@ -18,6 +19,18 @@ logger = logging.getLogger(
     "chemvista.ui.widgets.object_tree_widget.item_widgets")
 
 
+@functools.lru_cache(maxsize=None)
+def _icon(path: str) -> QIcon:
+    """Load an icon resource once and share it between item widgets"""
+    return QIcon(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _icon_pixmap(path: str, size: int) -> QPixmap:
+    """Render an icon resource to a square pixmap once per path and size"""
+    return _icon(path).pixmap(size, size)
+
+
 class ObjectTreeItem(QWidget):
     UNKNOWN_ICON = ":/icons/icons/circle-outline.svg"
 
@@ -62,7 +75,7 @@ class ObjectTreeItem(QWidget):
         logger.debug(f'object type: {obj_type}, icon path: {icon_path}')
 
         type_icon = QLabel()
-        type_icon.setPixmap(QIcon(icon_path).pixmap(24, 24))
+        type_icon.setPixmap(_icon_pixmap(icon_path, 24))
         layout.addWidget(type_icon)
 
         # Name label
@@ -88,7 +101,7 @@ class ObjectTreeItem(QWidget):
         self.settings_button = QPushButton()
         self.settings_button.setFixedSize(24, 24)
         self.settings_button.setToolTip("Open settings")
-        self.settings_button.setIcon(QIcon(self.COG_ICON))
+        self.settings_button.setIcon(_icon(self.COG_ICON))
         self.settings_button.clicked.connect(self._settings_clicked)
         self.settings_button.setFlat(True)
         layout.addWidget(self.settings_button)
@@ -106,10 +119,10 @@ class ObjectTreeItem(QWidget):
         self.obj.visible = value
 
     def _set_vis_on(self):
-        self.vis_button.setIcon(QIcon(self.EYE_ICON_OPEN))
+        self.vis_button.setIcon(_icon(self.EYE_ICON_OPEN))
 
     def _set_vis_off(self):
-        self.vis_button.setIcon(QIcon(self.EYE_ICON_CLOSED))
+        self.vis_button.setIcon(_icon(self.EYE_ICON_CLOSED))
 
     def _toggle_visibility(self, force_state):
         """Toggle visibility with optional forced state"""
@@ -171,7 +184,21 @@ class ScalarFieldTreeItem(ObjectTreeItem):
 class TrajectoryTreeItem(ObjectTreeItem):
     def __init__(self, name: str, obj, parent=None):
         super().__init__(name, 'trajectory', obj=obj, parent=parent)
-        # Trajectory-specific functionality could be added here
+
+        # Sparse trajectories show the sampling and offer to load every frame
+        if obj.is_sparse:
+            self.name_label.setText(f"{name} [sparse: 1/{obj.stride}]")
+            self.load_full_button = QPushButton("Load full")
+            self.load_full_button.setToolTip("Create the skipped frames")
+            self.load_full_button.clicked.connect(self._load_full_clicked)
+            # Place the button before the visibility and settings buttons
+            self.layout().insertWidget(
+                self.layout().indexOf(self.vis_button), self.load_full_button)
+
+    def _load_full_clicked(self):
+        """Handle load full button click"""
+        logger.debug(f"Loading all frames for {self.name}")
+        self.obj.load_all_frames()
 
 
 class DirectoryTreeItem(ObjectTreeItem):
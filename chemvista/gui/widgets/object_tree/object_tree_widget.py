@@ -119,7 +119,8 @@ class ObjectTreeWidget(QTreeWidget):
     def _refresh_tree(self):
         """Build or refresh the entire tree from the root node"""
         logger.debug("Starting tree refresh")
-        logger.debug(self.root.format_tree())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self.root.format_tree())
 
         # Save current selection before clearing
         previously_selected_uuid = self._current_selected_uuid
@@ -128,7 +129,7 @@ class ObjectTreeWidget(QTreeWidget):
         self._item_map.clear()
 
         # Skip the actual root node, start with its children
-        for child in self.root.children:
+        for child in self.root.iter_children():
             self._add_node_to_tree(child)
 
         # Expand the first level by default
@@ -139,7 +140,8 @@ class ObjectTreeWidget(QTreeWidget):
             self.select_item_by_uuid(previously_selected_uuid)
 
         logger.debug(f"Tree refreshed with {len(self._item_map)} items")
-        logger.debug(self.root.format_tree())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self.root.format_tree())
 
     def _add_node_to_tree(self, node: TreeNode, parent_item: Optional[QTreeWidgetItem] = None) -> QTreeWidgetItem:
         """Recursively add a node and its children to the tree"""
@@ -167,7 +169,7 @@ class ObjectTreeWidget(QTreeWidget):
             self.setItemWidget(item, 0, widget)
 
         # Recursively add children
-        for child in node.children:
+        for child in node.iter_children():
             self._add_node_to_tree(child, item)
 
         return item
@@ -233,7 +235,8 @@ class ObjectTreeWidget(QTreeWidget):
 
         # Update the tree
         logger.debug("Tree structure changed notification received")
-        logger.debug(self.root.format_tree())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self.root.format_tree())
         self._refresh_tree()
 
     def _check_tree_consistency(self):
@@ -327,14 +330,14 @@ class ObjectTreeWidget(QTreeWidget):
 
             # Calculate the index position in parent's children list
             if parent_node:
-                index = parent_node.children.index(relative_node)
+                index = parent_node.index_of(relative_node)
                 if position == 'below':
                     index += 1  # Insert after the target
 
                 # If source and target have the same parent, and we're moving below
                 # an item that is further down in the list, we need to adjust the index
                 if (moving_node.parent == parent_node and
-                        parent_node.children.index(moving_node) < index):
+                        parent_node.index_of(moving_node) < index):
                     index -= 1  # Adjust for the removal of the source node
                     logger.debug(
                         f"Adjusted index for same-parent move: {index}")
@@ -1,13 +1,33 @@
-import pyvista as pv
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+import pyvista as pv
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert nested dicts/lists into hashable tuples"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def settings_hash(settings: dict) -> int:
+    """Hash a settings dict so renderers can detect when it changes"""
+    return hash(_freeze(settings))
 
 
 class Renderer(ABC):
     """Base class for all renderers"""
 
+    def __init__(self):
+        # Maps cache key -> (settings hash, source data, meshes)
+        self._mesh_cache: Dict[str, tuple] = {}
+
     @abstractmethod
-    def render(self, obj, plotter: pv.Plotter, settings: dict, show: bool = False) -> None:
-        """Render an object to the plotter using provided settings"""
+    def render(self, obj, plotter: pv.Plotter, settings: dict, show: bool = False) -> List[Any]:
+        """Render an object to the plotter and return the actors added"""
         pass
 
     @abstractmethod
@@ -19,3 +39,22 @@ class Renderer(ABC):
     def validate_settings(self, settings: dict) -> bool:
         """Validate that the settings are appropriate for this renderer"""
         pass
+
+    def _get_cached_meshes(self, cache_key: Optional[str], settings_hash: Optional[int], source) -> Optional[Any]:
+        """Return cached meshes if neither the settings nor the source changed"""
+        if cache_key is None or settings_hash is None:
+            return None
+        entry = self._mesh_cache.get(cache_key)
+        if entry is not None and entry[0] == settings_hash and entry[1] is source:
+            return entry[2]
+        return None
+
+    def _store_cached_meshes(self, cache_key: Optional[str], settings_hash: Optional[int], source, meshes) -> None:
+        """Remember the meshes built for an object"""
+        if cache_key is not None and settings_hash is not None:
+            self._mesh_cache[cache_key] = (settings_hash, source, meshes)
+
+    def prune_cache(self, keep_keys: Iterable[str]) -> None:
+        """Drop cached meshes for every key not in keep_keys"""
+        for key in self._mesh_cache.keys() - set(keep_keys):
+            del self._mesh_cache[key]
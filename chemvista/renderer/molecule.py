@@ -1,18 +1,26 @@
 import numpy as np
 import pyvista as pv
+import functools
 import json
 import pathlib
-from typing import Optional, List
+from typing import Any, List, Optional
 from nx_ase.molecule import Molecule
 from .base import Renderer
 
 
+@functools.cache
+def load_atoms_settings() -> dict:
+    """Load the per-element radius/color table once and share it between renderers"""
+    settings_path = pathlib.Path(
+        __file__).parent / 'molecule_renderer_settings.json'
+    with open(settings_path) as f:
+        return json.load(f)
+
+
 class MoleculeRenderer(Renderer):
     def __init__(self):
-        settings_path = pathlib.Path(
-            __file__).parent / 'molecule_renderer_settings.json'
-        with open(settings_path) as f:
-            self.atoms_settings = json.load(f)
+        super().__init__()
+        self.atoms_settings = load_atoms_settings()
 
     def get_default_settings(self) -> dict:
         return {
@@ -26,28 +34,47 @@ class MoleculeRenderer(Renderer):
         required = {'show_hydrogens', 'show_numbers', 'alpha', 'resolution'}
         return all(key in settings for key in required)
 
-    def render(self, molecule: Molecule, plotter: pv.Plotter, settings: dict) -> None:
+    def render(self, molecule: Molecule, plotter: pv.Plotter, settings: dict,
+               cache_key: Optional[str] = None, settings_hash: Optional[int] = None,
+               positions: Optional[np.ndarray] = None, symbols: Optional[List[str]] = None) -> List[Any]:
+        """Render a molecule
+
+        positions and symbols may be passed in by callers that already hold
+        them, otherwise they are read from the molecule.
+        """
         if not self.validate_settings(settings):
             raise ValueError("Invalid settings for molecule rendering")
 
-        atoms_mesh = self._create_atoms_mesh(molecule, settings)
-        bonds_mesh = self._create_bonds_mesh(molecule, settings)
-
+        meshes = self._get_cached_meshes(cache_key, settings_hash, molecule)
+        if meshes is None:
+            if positions is None:
+                positions = molecule.positions
+            if symbols is None:
+                symbols = molecule.get_chemical_symbols()
+            meshes = (self._create_atoms_mesh(positions, symbols, settings),
+                      self._create_bonds_mesh(molecule, positions, symbols, settings))
+            self._store_cached_meshes(
+                cache_key, settings_hash, molecule, meshes)
+        atoms_mesh, bonds_mesh = meshes
+
+        actors = []
         if atoms_mesh is not None:
-            plotter.add_mesh(atoms_mesh, scalars='RGBA',
-                             rgb=True, smooth_shading=True)
+            actors.append(plotter.add_mesh(atoms_mesh, scalars='RGBA',
+                                           rgb=True, smooth_shading=True))
         if bonds_mesh is not None:
-            plotter.add_mesh(bonds_mesh, scalars='RGBA',
-                             rgb=True, smooth_shading=True)
+            actors.append(plotter.add_mesh(bonds_mesh, scalars='RGBA',
+                                           rgb=True, smooth_shading=True))
 
         if settings['show_numbers']:
-            self._add_atom_numbers(molecule, plotter)
+            actors.append(self._add_atom_numbers(molecule, plotter))
+
+        return actors
 
-    def _create_atoms_mesh(self, molecule: Molecule, settings: dict) -> Optional[pv.PolyData]:
+    def _create_atoms_mesh(self, positions: np.ndarray, symbols: List[str], settings: dict) -> Optional[pv.PolyData]:
         """Create a single mesh containing all atoms"""
         merged_spheres = None
 
-        for position, symbol in zip(molecule.positions, molecule.get_chemical_symbols()):
+        for position, symbol in zip(positions, symbols):
             if not settings['show_hydrogens'] and symbol == 'H':
                 continue
 
@@ -76,17 +103,19 @@ class MoleculeRenderer(Renderer):
 
         return merged_spheres
 
-    def _create_bonds_mesh(self, molecule: Molecule, settings: dict) -> Optional[pv.PolyData]:
+    def _create_bonds_mesh(self, molecule: Molecule, positions: np.ndarray, symbols: List[str],
+                           settings: dict) -> Optional[pv.PolyData]:
         """Create a single mesh containing all bonds"""
         merged_bonds = None
+        graph = molecule.G
 
         for bond in molecule.get_all_bonds():
-            if not settings['show_hydrogens'] and 'H' in [molecule.symbols[i] for i in bond]:
+            if not settings['show_hydrogens'] and 'H' in [symbols[i] for i in bond]:
                 continue
 
-            atom_a = molecule.positions[bond[0]]
-            atom_b = molecule.positions[bond[1]]
-            bond_type = molecule.G[bond[0]][bond[1]].get('bond_type', 1)
+            atom_a = positions[bond[0]]
+            atom_b = positions[bond[1]]
+            bond_type = graph[bond[0]][bond[1]].get('bond_type', 1)
 
             # Create cylinders for bond
             cylinders = self._create_bond_cylinders(
@@ -161,8 +190,8 @@ class MoleculeRenderer(Renderer):
         perp = np.cross(vector, basis_vectors[smallest])
         return perp / np.linalg.norm(perp)
 
-    def _add_atom_numbers(self, molecule: Molecule, plotter: pv.Plotter) -> None:
+    def _add_atom_numbers(self, molecule: Molecule, plotter: pv.Plotter):
         """Add atom numbers to the visualization"""
         poly = pv.PolyData(molecule.positions)
         poly["Labels"] = [str(i) for i in range(len(molecule))]
-        plotter.add_point_labels(poly, "Labels", point_size=20, font_size=36)
+        return plotter.add_point_labels(poly, "Labels", point_size=20, font_size=36)
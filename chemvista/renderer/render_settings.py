@@ -1,10 +1,39 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict
 import copy
 
+from .base import settings_hash
+
 
 @dataclass
 class RenderSettings:
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Assigning any field invalidates the cached dict and hash
+        self.__dict__.pop('_cache', None)
+
+    def _cached(self) -> tuple:
+        cache = self.__dict__.get('_cache')
+        if cache is None:
+            values = {f.name: getattr(self, f.name) for f in fields(self)}
+            cache = self.__dict__['_cache'] = (values, settings_hash(values))
+        return cache
+
+    def as_dict(self) -> dict:
+        """
+        Field values as a dict
+
+        The values are collected once and reused until a field is assigned;
+        each call returns a shallow copy, so callers may modify it without
+        affecting the cached hash. Containers held by the settings should be
+        replaced, not mutated in place, for the cached hash to stay valid.
+        """
+        return dict(self._cached()[0])
+
+    def hash_key(self) -> int:
+        """Hash of as_dict(), used by renderers to detect changed settings"""
+        return self._cached()[1]
+
     def copy(self):
         return copy.deepcopy(self)
 
@@ -1,3 +1,5 @@
+from typing import Any, List, Optional, Tuple
+
 import numpy as np
 import pyvista as pv
 from nx_ase.scalar_field import ScalarField
@@ -30,10 +32,16 @@ class ScalarFieldRenderer(Renderer):
         }
         return all(key in settings for key in required)
 
-    def render(self, field: ScalarField, plotter: pv.Plotter, settings: dict) -> None:
-        if not self.validate_settings(settings):
-            raise ValueError("Invalid settings for scalar field rendering")
+    @staticmethod
+    def create_grid(field: ScalarField) -> pv.StructuredGrid:
+        """Create a structured grid holding the field values
 
+        The flattened values are handed to VTK without a second copy, so the
+        grid can be cached and reused across renders. For a Fortran-ordered
+        field the grid shares memory with field.scalar_field; callers editing
+        the field in place must drop the cached grid (see
+        ScalarFieldObject.invalidate) to get new isosurfaces.
+        """
         # Create structured grid using the field coordinates
         grid = pv.StructuredGrid(
             field.points[..., 0],
@@ -41,8 +49,79 @@ class ScalarFieldRenderer(Renderer):
             field.points[..., 2]
         )
 
-        # Add scalar field data
-        grid.point_data["scalar_field"] = field.scalar_field.ravel(order='F')
+        # ravel returns a contiguous 1-D array: a view of a Fortran-ordered
+        # field, otherwise a copy
+        values = field.scalar_field.ravel(order='F')
+        grid.point_data.set_array(values, "scalar_field", deep_copy=False)
+        return grid
+
+    def render(self, field: ScalarField, plotter: pv.Plotter, settings: dict,
+               grid: Optional[pv.StructuredGrid] = None,
+               cache_key: Optional[str] = None, settings_hash: Optional[int] = None) -> List[Any]:
+        if not self.validate_settings(settings):
+            raise ValueError("Invalid settings for scalar field rendering")
+
+        if grid is None:
+            grid = self.create_grid(field)
+
+        isosurfaces = self._get_cached_meshes(cache_key, settings_hash, grid)
+        if isosurfaces is None:
+            isosurfaces = self._create_isosurfaces(field, grid, settings)
+            self._store_cached_meshes(
+                cache_key, settings_hash, grid, isosurfaces)
+
+        actors = []
+        for contour, color in isosurfaces:
+            actors.append(plotter.add_mesh(
+                contour,
+                color=color,
+                opacity=settings['opacity'],
+                show_scalar_bar=False
+            ))
+
+        # Show grid surface if requested
+        if settings['show_grid_surface']:
+            actors.append(plotter.add_mesh(
+                grid.outline(),
+                color=settings['grid_surface_color'],
+                opacity=0.1
+            ))
+
+        # Show grid points if requested
+        if settings['show_grid_points']:
+            actors.append(plotter.add_mesh(
+                grid,
+                style='points',
+                point_size=settings['grid_points_size'],
+                color=settings['grid_points_color'],
+                render_points_as_spheres=True
+            ))
+
+        # Show filtered points if requested
+        if settings['show_filtered_points']:
+            points_flat = field.points.reshape(-1, 3)
+            scalar_flat = field.scalar_field.ravel()
+            value_range = settings['point_value_range']
+
+            mask = (scalar_flat >= value_range[0]) & (
+                scalar_flat <= value_range[1])
+            selected_points = points_flat[mask]
+
+            if len(selected_points) > 0:
+                actors.append(plotter.add_points(
+                    selected_points,
+                    color=settings['grid_points_color'],
+                    point_size=settings['grid_points_size'],
+                    render_points_as_spheres=True
+                ))
+            else:
+                print(f"No points found in range {value_range}")
+
+        return actors
+
+    def _create_isosurfaces(self, field: ScalarField, grid: pv.StructuredGrid, settings: dict) -> List[Tuple[pv.PolyData, object]]:
+        """Create one (contour, color) pair per requested isosurface value"""
+        isosurfaces = []
 
         # Get isosurface values and colors
         isosurface_values = settings['isosurface_values']
@@ -56,9 +135,6 @@ class ScalarFieldRenderer(Renderer):
 
         # Create isosurfaces if values provided
         if isosurface_values and len(isosurface_values) > 0:
-            # Get data range for diagnostics
-            data_range = grid.get_data_range()
-
             # Create each isosurface separately with its corresponding color
             for i, (iso_value, color) in enumerate(zip(isosurface_values, colors)):
                 try:
@@ -81,15 +157,13 @@ class ScalarFieldRenderer(Renderer):
                         # Use the corresponding color for this isosurface
                         color = colors[i].strip() if isinstance(
                             colors[i], str) else colors[i]
-                        plotter.add_mesh(
-                            contour,
-                            color=color,
-                            opacity=settings['opacity'],
-                            show_scalar_bar=False
-                        )
+                        isosurfaces.append((contour, color))
                         print(
                             f'Contour with isovalue {iso_value} and color {color} created')
                     else:
+                        # Data range is only needed for diagnostics, so it
+                        # is computed here rather than for every render
+                        data_range = grid.get_data_range()
                         print(
                             f"No isosurface found for value {iso_value}")
                         print(
@@ -105,40 +179,4 @@ class ScalarFieldRenderer(Renderer):
                     print(f"Min: {np.min(field.scalar_field)}")
                     print(f"Max: {np.max(field.scalar_field)}")
 
-        # Show grid surface if requested
-        if settings['show_grid_surface']:
-            plotter.add_mesh(
-                grid.outline(),
-                color=settings['grid_surface_color'],
-                opacity=0.1
-            )
-
-        # Show grid points if requested
-        if settings['show_grid_points']:
-            plotter.add_mesh(
-                grid,
-                style='points',
-                point_size=settings['grid_points_size'],
-                color=settings['grid_points_color'],
-                render_points_as_spheres=True
-            )
-
-        # Show filtered points if requested
-        if settings['show_filtered_points']:
-            points_flat = field.points.reshape(-1, 3)
-            scalar_flat = field.scalar_field.ravel()
-            value_range = settings['point_value_range']
-
-            mask = (scalar_flat >= value_range[0]) & (
-                scalar_flat <= value_range[1])
-            selected_points = points_flat[mask]
-
-            if len(selected_points) > 0:
-                plotter.add_points(
-                    selected_points,
-                    color=settings['grid_points_color'],
-                    point_size=settings['grid_points_size'],
-                    render_points_as_spheres=True
-                )
-            else:
-                print(f"No points found in range {value_range}")
+        return isosurfaces
@@ -1,15 +1,12 @@
 import logging
+import operator
 import pathlib
-import uuid
-from typing import Dict, Iterator, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Union
 
-import numpy as np
 import pyvista as pv
 from nx_ase import Molecule, ScalarField, Trajectory
 
 from .renderer import MoleculeRenderer, ScalarFieldRenderer
-from .renderer.render_settings import (MoleculeRenderSettings,
-                                       ScalarFieldRenderSettings)
 from .scene_objects import (MoleculeObject, ScalarFieldObject, SceneObject,
                             TrajectoryObject)
 from .tree_structure import TreeNode, TreeSignals
@@ -27,6 +24,21 @@ class SceneManager():
         self.scalar_field_renderer = ScalarFieldRenderer()
         self.plotter = None
 
+        # RENDER_KIND -> (source getter, render method) used by render
+        self._render_dispatch = {
+            'molecule': (operator.attrgetter('molecule'), self._render_molecule),
+            'scalar_field': (operator.attrgetter('vtk_grid'), self._render_scalar_field),
+        }
+
+        # Maps uuid -> (settings hash, source data, actors) for the plotter
+        # last rendered with reuse_actors=True
+        self._actors: Dict[str, tuple] = {}
+        self._actors_plotter = None
+
+        # Scene bounds the camera was last reset to, and on which plotter
+        self._camera_bounds = None
+        self._camera_plotter = None
+
         # Create a generic root node (not a SceneObject)
         self.root = TreeNode(name="Scene", node_type="root")
 
@@ -43,7 +55,7 @@ class SceneManager():
     def tree_signals(self, value):
         """Set the signals object"""
         self._tree_signals = value
-        for node_path, tree_node in self.root.iter_tree():
+        for tree_node in self.root.iter_nodes():
             logger.debug(f"Setting signals for {tree_node.name}")
             tree_node.signals = value
 
@@ -72,10 +84,21 @@ class SceneManager():
     def load_xyz(self, filepath: Union[str, pathlib.Path]) -> Union[MoleculeObject, TrajectoryObject]:
         """Load molecule or trajectory from XYZ file and return object"""
         filepath = pathlib.Path(filepath)
-        if not filepath.exists():
+        try:
+            filepath.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File {filepath} not found")
 
         path = Trajectory.load(filepath)
+        return self.add_xyz_data(path, filepath)
+
+    def add_xyz_data(self, path: Trajectory, filepath: Union[str, pathlib.Path]) -> Union[MoleculeObject, TrajectoryObject]:
+        """Add an already parsed XYZ file to the scene and return the object
+
+        Split from load_xyz so that parsing can run on a worker thread while
+        the scene objects are still created on the thread owning the tree.
+        """
+        filepath = pathlib.Path(filepath)
 
         # If there's only one frame, treat it as a regular molecule
         if len(path) == 1:
@@ -113,7 +136,9 @@ class SceneManager():
         filepath = pathlib.Path(filepath)
         logger.info(f"Loading molecule with scalar field from {filepath}")
 
-        if not filepath.exists():
+        try:
+            filepath.stat()
+        except FileNotFoundError:
             logger.error(f"File {filepath} not found")
             raise FileNotFoundError(f"File {filepath} not found")
 
@@ -134,8 +159,14 @@ class SceneManager():
     def load_scalar_field_from_cube(self, filepath: Union[str, pathlib.Path]) -> ScalarFieldObject:
         """Load scalar field from cube file"""
         filepath = pathlib.Path(filepath)
+        try:
+            filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File {filepath} not found")
 
-        field_obj = ScalarFieldObject.from_cube_file(filepath)
+        # Parse now so a malformed file is reported here instead of breaking
+        # a later render
+        field_obj = ScalarFieldObject.from_cube_file(filepath, lazy=False)
 
         # Add to root AFTER registration
         success, message = self.root.add_child(field_obj)
@@ -160,6 +191,13 @@ class SceneManager():
 
         return traj_obj
 
+    def bulk_update(self):
+        """
+        Context manager that coalesces the structure signals of the whole
+        scene until the block exits
+        """
+        return self.root.batch_structure_changes()
+
     def get_object_by_uuid(self, uuid: str) -> Union[TreeNode, SceneObject]:
         """Get object by UUID"""
         return self.root.get_object_by_uuid(uuid)
@@ -191,38 +229,109 @@ class SceneManager():
 
         obj.update_settings(settings)
 
-    def render(self, plotter: Optional[pv.Plotter] = None, **kwargs) -> pv.Plotter:
-        """Render all visible objects"""
+    def render(self, plotter: Optional[pv.Plotter] = None, reuse_actors: bool = False, **kwargs) -> pv.Plotter:
+        """Render all visible objects
+
+        With reuse_actors the plotter is expected to still hold the actors of
+        the previous reuse_actors render: actors of unchanged objects are left
+        in place, and only new, changed, hidden or removed objects touch the
+        plotter. Otherwise the plotter is assumed to be empty.
+        """
         if plotter is None:
-            if self.plotter is not None:
+            if self.plotter is not None and not reuse_actors:
                 self.plotter.clear()
+                if self.plotter is self._actors_plotter:
+                    self._actors_plotter = None
             plotter = self.plotter or self.create_plotter(**kwargs)
 
+        # Actors are only tracked for the plotter rendered with reuse_actors
+        if reuse_actors and plotter is not self._actors_plotter:
+            self._actors_plotter = plotter
+            self._actors = {}
+        actors_by_uuid = self._actors if reuse_actors else {}
+
+        rendered_uuids = []
+
         # Use the TreeNode's iter_visible to efficiently render only visible nodes
         for obj in self.root.iter_visible():
             # Skip root node
-            if obj == self.root:
+            if obj is self.root:
                 continue
 
             # Render based on object type
-            if isinstance(obj, MoleculeObject):
-                self.molecule_renderer.render(
-                    molecule=obj.molecule,
-                    plotter=plotter,
-                    settings=vars(obj.render_settings)
-                )
-            elif isinstance(obj, ScalarFieldObject):
-                self.scalar_field_renderer.render(
-                    field=obj.scalar_field,
-                    plotter=plotter,
-                    settings=vars(obj.render_settings)
-                )
-
-        plotter.reset_camera()
+            dispatch = self._render_dispatch.get(obj.RENDER_KIND)
+            if dispatch is None:
+                continue
+            get_source, render_object = dispatch
+            source = get_source(obj)
+            if source is None:
+                # Nothing to draw, e.g. a lazily loaded field that failed
+                continue
+            rendered_uuids.append(obj.uuid)
+
+            # The revision changes when the data was edited in place, which
+            # the source identity check alone cannot see
+            key = hash((obj.render_settings.hash_key(), obj.revision))
+            entry = actors_by_uuid.get(obj.uuid)
+            if entry is not None:
+                if entry[0] == key and entry[1] is source:
+                    continue
+                self._remove_actors(plotter, obj.uuid)
+
+            actors = render_object(obj, source, plotter, key)
+            if reuse_actors:
+                actors_by_uuid[obj.uuid] = (key, source, actors)
+
+        # Take down the actors of objects that are hidden or gone
+        for uuid in actors_by_uuid.keys() - set(rendered_uuids):
+            self._remove_actors(plotter, uuid)
+
+        # Forget meshes of objects that are hidden or gone
+        self.molecule_renderer.prune_cache(rendered_uuids)
+        self.scalar_field_renderer.prune_cache(rendered_uuids)
+
+        # Only move the camera when the extent of the scene changed
+        bounds = tuple(plotter.bounds)
+        if plotter is not self._camera_plotter or bounds != self._camera_bounds:
+            plotter.reset_camera()
+            self._camera_plotter = plotter
+            self._camera_bounds = bounds
         return plotter
 
+    def _render_molecule(self, obj: MoleculeObject, molecule: Molecule, plotter: pv.Plotter, key: int) -> list:
+        """Draw a molecule object and return its actors"""
+        return self.molecule_renderer.render(
+            molecule=molecule,
+            plotter=plotter,
+            settings=obj.render_settings.as_dict(),
+            cache_key=obj.uuid,
+            settings_hash=key,
+            positions=obj.positions,
+            symbols=obj.chemical_symbols
+        )
+
+    def _render_scalar_field(self, obj: ScalarFieldObject, grid: pv.StructuredGrid, plotter: pv.Plotter, key: int) -> list:
+        """Draw a scalar field object and return its actors"""
+        return self.scalar_field_renderer.render(
+            field=obj.scalar_field,
+            plotter=plotter,
+            settings=obj.render_settings.as_dict(),
+            grid=grid,
+            cache_key=obj.uuid,
+            settings_hash=key
+        )
+
+    def _remove_actors(self, plotter: pv.Plotter, uuid: str) -> None:
+        """Remove the actors recorded for an object from the plotter"""
+        _, _, actors = self._actors.pop(uuid)
+        for actor in actors:
+            plotter.remove_actor(actor, reset_camera=False, render=False)
+
     def log_tree_changes(self, message: str = ""):
         """Log the current tree structure"""
+        # Formatting a large tree is costly, skip it when nothing is logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if message:
             logger.info(f"Tree Change: {message}")
         logger.info("\n" + self.root.format_tree())
@@ -234,8 +343,10 @@ class SceneManager():
             logger.warning(f"Object with UUID {uuid} not found")
             return
 
-        # Use the TreeNode method to remove the object
-        self.root.remove_child(obj)
+        # Detach the whole subtree from its own parent in one step; the
+        # descendants leave the tree with it and need no per-node work
+        if obj.parent is not None:
+            obj.parent.remove_child(obj)
         logger.info(f"Deleted object with UUID {uuid}")
 
     def move_object(self, uuid: str, new_parent_uuid: str, position=None) -> None:
@@ -1,8 +1,12 @@
+import bisect
 import logging
+import os
 import pathlib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import (Any, Dict, Generic, Iterator, List, Optional, Tuple,
+from typing import (Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple,
                     TypeVar, Union)
 
 import pyvista as pv
@@ -13,7 +17,7 @@ from .renderer import MoleculeRenderer, ScalarFieldRenderer
 from .renderer.render_settings import (MoleculeRenderSettings,
                                        ScalarFieldRenderSettings,
                                        TrajectoryRenderSettings)
-from .tree_structure import NodePath, TreeNode, TreeSignals
+from .tree_structure import NodePath, TreeNode, TreeSignals, move_dict_key
 
 # Create a logger for this module
 logger = logging.getLogger("chemvista.scene")
@@ -21,7 +25,64 @@ logger = logging.getLogger("chemvista.scene")
 T = TypeVar('T')  # Generic type for scene object data
 
 
+def _check_child_type(node: 'SceneObject', child: TreeNode) -> Tuple[bool, str]:
+    """Reject children that are not instances of node.ALLOWED_CHILD_TYPES"""
+    if node.ALLOWED_CHILD_TYPES is not None and not isinstance(child, node.ALLOWED_CHILD_TYPES):
+        return False, node.CHILD_TYPE_ERROR
+    return True, ""
+
+
+def _check_unique_name(node: 'SceneObject', child: TreeNode) -> Tuple[bool, str]:
+    """Reject children whose name is already used by a sibling"""
+    if node.has_child_named(child.name):
+        return False, node.DUPLICATE_NAME_ERROR.format(name=child.name)
+    return True, ""
+
+
+def _check_all_frames_loaded(node: 'TrajectoryObject', child: TreeNode) -> Tuple[bool, str]:
+    """Reject new frames while a sparse load has skipped some images"""
+    if node.is_sparse:
+        return False, f'Load all frames of {node.name} before adding frames'
+    return True, ""
+
+
+def _load_concurrently(load: Callable[[pathlib.Path], Any], paths: List[pathlib.Path]) -> List[Any]:
+    """Call load on every path using a thread pool, results keep the order of paths"""
+    if len(paths) < 2:
+        return [load(path) for path in paths]
+    # File reads and numpy parsing release the GIL, so threads overlap the I/O
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+        return list(executor.map(load, paths))
+
+
 class SceneObject(TreeNode[T]):
+    __slots__ = ('_render_settings', '_render_batch_depth', '_render_pending',
+                 '_revision')
+
+    # Types accepted as children; None means no restriction
+    ALLOWED_CHILD_TYPES: Optional[Tuple[type, ...]] = None
+    CHILD_TYPE_ERROR = ''
+    DUPLICATE_NAME_ERROR = 'A child with name {name} already exists'
+    # Checks run in order by _can_add_child, each called as check(node, child)
+    CHILD_VALIDATORS: Tuple[Callable[['SceneObject', TreeNode], Tuple[bool, str]], ...] = (
+        _check_child_type,)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._render_batch_depth = 0
+        self._render_pending = False
+        # Bumped by invalidate, part of the key cached meshes and actors are
+        # checked against
+        self._revision = 0
+
+    def _can_add_child(self, child):
+        """Run the class-level CHILD_VALIDATORS, stopping at the first failure"""
+        for validator in self.CHILD_VALIDATORS:
+            can_add, msg = validator(self, child)
+            if not can_add:
+                return can_add, msg
+        return True, ""
+
     @property
     def render_settings(self):
         return self._render_settings
@@ -29,44 +90,163 @@ class SceneObject(TreeNode[T]):
     @render_settings.setter
     def render_settings(self, value):
         self._render_settings = value
-        if self.signals:
+        if self._render_batch_depth:
+            self._render_pending = True
+        elif self.signals:
+            self.signals.render_changed.emit(self.uuid)
+
+    @contextmanager
+    def batch_render(self):
+        """Emit a single render_changed for all settings changes made inside the block"""
+        self._render_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._render_batch_depth -= 1
+            if not self._render_batch_depth and self._render_pending:
+                self._render_pending = False
+                if self.signals:
+                    self.signals.render_changed.emit(self.uuid)
+
+    @property
+    def revision(self) -> int:
+        """Number of times the data was reported as edited in place"""
+        return self._revision
+
+    def invalidate(self, send_signals: bool = True) -> None:
+        """Drop cached data derived from the object after editing it in place"""
+        self._revision += 1
+        if send_signals and self.signals:
             self.signals.render_changed.emit(self.uuid)
 
 
 class ScalarFieldObject(SceneObject):
-    def __init__(self, name: str, scalar_field: ScalarField, parent=None, visible=True, signals: Optional[TreeSignals] = None):
+    __slots__ = ('_vtk_cache', '_source_path')
+
+    RENDER_KIND = 'scalar_field'
+    ALLOWED_CHILD_TYPES = ()
+    CHILD_TYPE_ERROR = 'Scalar field objects cannot have children'
+
+    def __init__(self, name: str, scalar_field: Optional[ScalarField], parent=None, visible=True, signals: Optional[TreeSignals] = None):
         super().__init__(name=name, data=scalar_field,
                          node_type="scalar_field", parent=parent, visible=visible, signals=signals)
-        self.scalar_field = scalar_field
+        self._vtk_cache: Optional[pv.StructuredGrid] = None
+        # Cube file to read the field from on first access (lazy loading)
+        self._source_path: Optional[pathlib.Path] = None
         self._render_settings = ScalarFieldRenderSettings()
 
-    def _can_add_child(self, child):
-        return False, 'Scalar field objects cannot have children'
+    @property
+    def scalar_field(self) -> Optional[ScalarField]:
+        """The field, stored as the node data, None if it could not be loaded"""
+        if self.data is None and self._source_path is not None:
+            logger.info(
+                f"Loading scalar field {self.name} from {self._source_path}")
+            try:
+                self.scalar_field = ScalarField.load_cube(self._source_path)
+            except Exception as e:
+                # Keep a bad file from failing every later render
+                logger.error(
+                    f"Failed to load scalar field {self.name} from {self._source_path}: {e}")
+                self._source_path = None
+        return self.data
+
+    @scalar_field.setter
+    def scalar_field(self, value: Optional[ScalarField]):
+        self.data = value
+        self._vtk_cache = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the field values have been read into memory"""
+        return self.data is not None
+
+    @property
+    def vtk_grid(self) -> Optional[pv.StructuredGrid]:
+        """VTK grid wrapping the field values, built once and reused across renders
+
+        None when the field could not be loaded.
+        """
+        if self._vtk_cache is None:
+            scalar_field = self.scalar_field
+            if scalar_field is None:
+                return None
+            self._vtk_cache = ScalarFieldRenderer.create_grid(scalar_field)
+        return self._vtk_cache
+
+    def invalidate(self, send_signals: bool = True) -> None:
+        """Drop cached data derived from the field after editing it in place"""
+        self._vtk_cache = None
+        super().invalidate(send_signals=send_signals)
 
     @classmethod
-    def from_cube_file(cls, path: Union[str, pathlib.Path], name: Optional[str] = None, parent=None, visible=True) -> 'ScalarFieldObject':
-        scalar_field = ScalarField.load_cube(path)
+    def from_cube_file(cls, path: Union[str, pathlib.Path], name: Optional[str] = None, parent=None, visible=True, lazy: bool = True) -> 'ScalarFieldObject':
+        """
+        Create a scalar field object from a cube file
+
+        With lazy=True the grid is only read when the field is first
+        accessed (typically on the first render).
+        """
         if name is None:
             name = pathlib.Path(path).stem
+        if lazy:
+            field_object = cls(name, None, parent, visible)
+            field_object._source_path = pathlib.Path(path)
+            return field_object
+        scalar_field = ScalarField.load_cube(path)
         return cls(name, scalar_field, parent, visible)
 
 
 class MoleculeObject(SceneObject):
+    __slots__ = ('_atom_cache',)
+
+    RENDER_KIND = 'molecule'
+    ALLOWED_CHILD_TYPES = (ScalarFieldObject,)
+    CHILD_TYPE_ERROR = 'Molecule objects can only have scalar fields as children'
+    CHILD_VALIDATORS = (_check_child_type, _check_unique_name)
+
     def __init__(self, name: str, molecule: Molecule, parent=None, visible=True, signals: Optional[TreeSignals] = None):
         super().__init__(name=name, data=molecule,
                          node_type="molecule", parent=parent, visible=visible, signals=signals)
-        self.molecule = molecule
         self._render_settings = MoleculeRenderSettings()
+        # Per-atom arrays read from the molecule, kept until invalidate()
+        self._atom_cache: Dict[str, Any] = {}
 
-    def _can_add_child(self, child):
-        """Override to restrict children to scalar fields"""
-        if not isinstance(child, ScalarFieldObject):
-            return False, 'Molecule objects can only have scalar fields as children'
+    @property
+    def molecule(self) -> Molecule:
+        """The molecule, stored as the node data"""
+        return self.data
+
+    @molecule.setter
+    def molecule(self, value: Molecule):
+        self.data = value
+        self._atom_cache = {}
+
+    def _cached_atom_array(self, key: str, getter: Callable[[Molecule], Any]) -> Any:
+        """Read a per-atom array from the molecule once and reuse it"""
+        value = self._atom_cache.get(key)
+        if value is None:
+            value = self._atom_cache[key] = getter(self.molecule)
+        return value
 
-        if child.name in [c.name for c in self.children]:
-            return False, f'A child with name {child.name} already exists'
+    @property
+    def positions(self):
+        """Atom positions, memoized until the object is invalidated"""
+        return self._cached_atom_array('positions', Molecule.get_positions)
 
-        return True, ""
+    @property
+    def atomic_numbers(self):
+        """Atomic numbers, memoized until the object is invalidated"""
+        return self._cached_atom_array('atomic_numbers', Molecule.get_atomic_numbers)
+
+    @property
+    def chemical_symbols(self) -> List[str]:
+        """Chemical symbols, memoized until the object is invalidated"""
+        return self._cached_atom_array('chemical_symbols', Molecule.get_chemical_symbols)
+
+    def invalidate(self, send_signals: bool = True) -> None:
+        """Drop the memoized atom arrays after editing the molecule in place"""
+        self._atom_cache = {}
+        super().invalidate(send_signals=send_signals)
 
     def add_child(self, child: SceneObject, position: Optional[int] = None, send_signals: bool = True) -> Tuple[bool, str]:
         """Add a scalar field to molecule and maintain data relationship"""
@@ -76,17 +256,11 @@ class MoleculeObject(SceneObject):
         if not success:
             return success, msg
 
-        # If it's a scalar field, update the molecule's data
-        if isinstance(child, ScalarFieldObject):
-            self.molecule.scalar_fields[child.name] = child.scalar_field
-        else:
-            # This should never happen due to the _can_add_child check, but just in case
-            raise NotImplementedError(
-                "Only ScalarFieldObjects can be added as children to MoleculeObject")
+        # _can_add_child guarantees a scalar field, update the molecule's data
+        self.molecule.scalar_fields[child.name] = child.scalar_field
 
         if send_signals and self._signals:
-            self._signals.node_added.emit(child.uuid)
-            self._signals.tree_structure_changed.emit()
+            self._announce_added(child)
 
         return success, msg
 
@@ -94,173 +268,453 @@ class MoleculeObject(SceneObject):
         """Remove child and also update the molecule data"""
 
         child = super().remove_child(child, send_signals=False)
+        if child is None:
+            return None
 
         scalar_field = self.molecule.scalar_fields.pop(child.name, None)
 
         if send_signals and self._signals:
-            self._signals.node_removed.emit(child.uuid)
-            self._signals.tree_structure_changed.emit()
+            self._announce_removed(child.uuid)
 
         return child
 
+    def remove_children(self, children: List[SceneObject], send_signals: bool = True) -> List[SceneObject]:
+        """Remove several scalar fields and their molecule data at once"""
+        removed = super().remove_children(children, send_signals=False)
+        for child in removed:
+            self.molecule.scalar_fields.pop(child.name, None)
+
+        if send_signals and self._signals and removed:
+            with self._signals.batch_structure_changes():
+                for child in removed:
+                    self._signals.announce_removed(child.uuid)
+
+        return removed
+
     def reorder_child(self, child: SceneObject, new_position: int, send_signals=True):
         """Reorder the child with the given UUID to the new position"""
 
+        if child.uuid not in self._children:
+            return False, "Child does not belong to this parent"
+        # Scalar fields are stored in the same order as the children
+        old_position = self.index_of(child)
+
         success, msg = super().reorder_child(child, new_position, send_signals=False)
         if not success:
             return success, msg
+        new_position = self.index_of(child)
+        if old_position == new_position:
+            return success, msg
 
-        # Get current positions of scalar fields in both children and molecule
-        children_list = list(self._children.values())
-        old_position = children_list.index(child.name)
-
-        items = list(self.molecule.scalar_fields.items())
-        item = items.pop(old_position)
-        items.insert(new_position, item)
-        self.molecule.scalar_fields = dict(items)
-
-        if not success:
-            raise ValueError('Failed to reorder children: ' + msg)
+        move_dict_key(self.molecule.scalar_fields, child.name, new_position)
 
         if send_signals and self._signals:
-            self._signals.tree_structure_changed.emit()
+            self._signals.announce_structure_changed()
 
         return True, f'Successfully reordered {child.name} to position {new_position}'
 
     @classmethod
-    def from_molecule(cls, molecule: Molecule, name: str, parent=None, visible=True, signals: Optional[TreeSignals] = None, send_signals=True) -> 'MoleculeObject':
+    def from_molecule(cls, molecule: Molecule, name: str, parent=None, visible=True, signals: Optional[TreeSignals] = None) -> 'MoleculeObject':
         molecule_object = cls(name, molecule, parent, visible, signals)
-        for scalar_field_name, scalar_field in molecule.scalar_fields.items():
-            scalar_field_object = ScalarFieldObject(
-                scalar_field_name, scalar_field, molecule_object, visible, signals)
-            molecule_object._children[scalar_field_object.uuid] = scalar_field_object
-
-        if send_signals and molecule_object._signals:
-            molecule_object._signals.tree_structure_changed
+        molecule_object._attach_children([
+            ScalarFieldObject(scalar_field_name, scalar_field,
+                              molecule_object, visible, signals)
+            for scalar_field_name, scalar_field in molecule.scalar_fields.items()
+        ])
+        # The children are announced together with the molecule once it is
+        # attached to the tree
 
         return molecule_object
 
     @classmethod
-    def from_xyz_file(cls, path: Union[str, pathlib.Path], name: Optional[str] = None, parent=None, visible=True, signals: Optional[TreeSignals] = None, send_signals=True) -> 'MoleculeObject':
+    def from_xyz_file(cls, path: Union[str, pathlib.Path], name: Optional[str] = None, parent=None, visible=True, signals: Optional[TreeSignals] = None) -> 'MoleculeObject':
         molecule = Molecule.load(path)
         if name is None:
             name = pathlib.Path(path).stem
-        return cls.from_molecule(molecule, name, parent, visible, signals, send_signals=send_signals)
+        return cls.from_molecule(molecule, name, parent, visible, signals)
 
     @classmethod
-    def from_cube_file(cls, path: Union[str, pathlib.Path], name: Optional[str] = None, parent=None, visible=True, signals: Optional[TreeSignals] = None, send_signals=True) -> 'MoleculeObject':
+    def from_cube_file(cls, path: Union[str, pathlib.Path], name: Optional[str] = None, parent=None, visible=True, signals: Optional[TreeSignals] = None) -> 'MoleculeObject':
         if name is None:
             name = pathlib.Path(path).stem
 
         scalar_field_name = name+'_field'
         molecule = Molecule.load_from_cube(path, name=scalar_field_name)
-        return cls.from_molecule(molecule, name, parent, visible, signals, send_signals=send_signals)
+        return cls.from_molecule(molecule, name, parent, visible, signals)
+
+    @classmethod
+    def from_xyz_files(cls, paths: List[Union[str, pathlib.Path]], signals: Optional[TreeSignals] = None) -> List['MoleculeObject']:
+        """
+        Create one molecule object per xyz file, parsing the files concurrently
+
+        Only the parsing runs on worker threads; the objects are created on
+        the calling thread, in the order of paths.
+        """
+        paths = [pathlib.Path(path) for path in paths]
+        molecules = _load_concurrently(Molecule.load, paths)
+        return [cls.from_molecule(molecule, path.stem, signals=signals)
+                for path, molecule in zip(paths, molecules)]
+
+    @classmethod
+    def from_cube_files(cls, paths: List[Union[str, pathlib.Path]], signals: Optional[TreeSignals] = None) -> List['MoleculeObject']:
+        """Create one molecule object with its field per cube file, parsing the files concurrently"""
+        paths = [pathlib.Path(path) for path in paths]
+        molecules = _load_concurrently(
+            lambda path: Molecule.load_from_cube(path, name=path.stem + '_field'), paths)
+        return [cls.from_molecule(molecule, path.stem, signals=signals)
+                for path, molecule in zip(paths, molecules)]
 
 
 class TrajectoryObject(SceneObject):
     """Represents a trajectory object with multiple frames"""
 
+    __slots__ = ('_active_index', '_stride', '_image_indices')
+
+    ALLOWED_CHILD_TYPES = (MoleculeObject,)
+    CHILD_TYPE_ERROR = 'Trajectory objects can only have molecules as children'
+    DUPLICATE_NAME_ERROR = 'A molecule with name {name} already exists in this trajectory'
+    CHILD_VALIDATORS = (_check_child_type, _check_unique_name,
+                        _check_all_frames_loaded)
+    # A hidden trajectory hides all of its frames
+    PROPAGATE_VISIBILITY = True
+
     def __init__(self, name: str, trajectory: Trajectory, parent=None, visible=True, signals: Optional[TreeSignals] = None):
-        super().__init__(name=name, node_type="trajectory",
+        super().__init__(name=name, data=trajectory, node_type="trajectory",
                          parent=parent, visible=visible, signals=signals)
-        self.trajectory = trajectory
         self._render_settings = TrajectoryRenderSettings()
-        self.data = trajectory
+        self._active_index = 0
+        # Step between trajectory images that have a frame node (see from_trajectory)
+        self._stride = 1
+        # Trajectory image index of each frame node, in child order; None
+        # when every image has a frame node
+        self._image_indices: Optional[List[int]] = None
 
-    def _can_add_child(self, child):
-        """Override to restrict children to molecules"""
-        if not isinstance(child, MoleculeObject):
-            return False, 'Trajectory objects can only have molecules as children'
+    @property
+    def trajectory(self) -> Trajectory:
+        """The trajectory, stored as the node data"""
+        return self.data
 
-        if child.name in [c.name for c in self.children]:
-            return False, f'A molecule with name {child.name} already exists in this trajectory'
+    @trajectory.setter
+    def trajectory(self, value: Trajectory):
+        self.data = value
 
-        return True, ""
+    @property
+    def active_frame(self) -> int:
+        """Index of the frame currently shown"""
+        return self._active_index
+
+    @property
+    def stride(self) -> int:
+        """Step between the trajectory images shown as frames"""
+        return self._stride
+
+    @property
+    def is_sparse(self) -> bool:
+        """Whether some trajectory images have no frame node yet"""
+        return self._image_indices is not None
+
+    def _image_index(self, position: int) -> int:
+        """Trajectory image index of the frame node at position"""
+        if self._image_indices is None:
+            return position
+        return self._image_indices[position]
+
+    def __getitem__(self, index: int) -> MoleculeObject:
+        """
+        Frame node for trajectory image index
+
+        On a sparse trajectory a skipped frame is created and inserted in
+        image order the first time it is asked for.
+        """
+        if not 0 <= index < len(self.trajectory):
+            raise IndexError(
+                f"Frame index {index} out of range for trajectory {self.name}")
+        frames = list(self._children.values())
+        indices = self._image_indices
+        if indices is None:
+            return frames[index]
+        position = bisect.bisect_left(indices, index)
+        if position < len(indices) and indices[position] == index:
+            return frames[position]
+
+        frame = self._create_frame(index, visible=False)
+        self._attach_children([frame])
+        frames.insert(position, frame)
+        self._children = {node.uuid: node for node in frames}
+        self._positions = None
+        indices.insert(position, index)
+        if len(frames) > 1 and position <= self._active_index:
+            self._active_index += 1
+        if len(indices) == len(self.trajectory):
+            self._image_indices = None
+            self._stride = 1
+
+        # Frames of a detached trajectory are announced when it is attached
+        if self._signals and self._attached_parent() is not None:
+            self._announce_added(frame)
+        return frame
+
+    def _format_detail(self) -> str:
+        if self.is_sparse:
+            return f"[{len(self._children)} frames, 1/{self._stride}]"
+        return f"[{len(self._children)} frames]"
+
+    def _create_frame(self, index: int, visible: bool) -> MoleculeObject:
+        """Create the (unattached) frame node for trajectory image index"""
+        # No per-frame logging here: formatting the message (including the
+        # signals repr) would run for every frame even with debug disabled
+        return MoleculeObject.from_molecule(
+            molecule=self.trajectory[index], name=f'Frame_{index}', parent=self, visible=visible,
+            signals=self._signals)
+
+    def load_all_frames(self, send_signals: bool = True) -> List[MoleculeObject]:
+        """Create the frames skipped by a sparse load, returns the new frames
+
+        Existing frames keep their nodes; the active frame stays active.
+        """
+        if not self.is_sparse:
+            return []
+
+        indices = self._image_indices
+        existing = dict(zip(indices, self._children.values()))
+        frames = []
+        added = []
+        for i in range(len(self.trajectory)):
+            frame = existing.get(i)
+            if frame is None:
+                frame = self._create_frame(i, visible=False)
+                added.append(frame)
+            frames.append(frame)
+
+        self._attach_children(added)
+        # Put the new frames between the existing ones
+        self._children = {frame.uuid: frame for frame in frames}
+        self._positions = None
+        if indices:
+            self._active_index = indices[self._active_index]
+        self._image_indices = None
+        self._stride = 1
+        logger.info(
+            f"Loaded {len(added)} skipped frames of trajectory {self.name}")
+
+        # Frames of a detached trajectory are announced when it is attached
+        if send_signals and self._signals and added and self._attached_parent() is not None:
+            self._signals.announce_bulk_added([frame.uuid for frame in added])
+
+        return added
+
+    def set_active_frame(self, index: int, send_signals: bool = True) -> bool:
+        """Show only the frame at index, hiding every other frame"""
+        if not 0 <= index < len(self._children):
+            logger.warning(
+                f"Invalid frame index {index} for trajectory {self.name}")
+            return False
+
+        changed = []
+        for i, frame in enumerate(self._children.values()):
+            visible = i == index
+            if frame._visible != visible:
+                # Flip the flag directly so a single render is requested below
+                frame._visible = visible
+                changed.append(frame)
+        self._active_index = index
+
+        if send_signals and self._signals and changed:
+            for frame in changed:
+                self._signals.visibility_changed.emit(
+                    frame.uuid, frame.visible)
+            self._signals.announce_structure_changed()
+            self._signals.render_changed.emit(self.uuid)
+
+        return True
+
+    def _visible_subtrees(self):
+        """Skip the subtrees of hidden frames"""
+        return [frame for frame in self._children.values() if frame.visible]
 
     def add_child(self, child: SceneObject, position: Optional[int] = None, send_signals: bool = True) -> Tuple[bool, str]:
-        """Add a molecule to trajectory and maintain data relationship"""
+        """Add a molecule to trajectory and maintain data relationship
 
+        Sparse trajectories reject new frames, as there is no image position
+        matching a frame position (see _check_all_frames_loaded).
+        """
         success, msg = super().add_child(
             child=child, position=position, send_signals=False)
         if not success:
             return success, msg
 
-        # If it's a molecule, update the trajectory's data
-        if isinstance(child, MoleculeObject):
-            if position is None or position >= len(self.trajectory):
-                self.trajectory.append(child.molecule)
-            else:
-                self.trajectory.insert(position, child.molecule)
+        # _can_add_child guarantees a molecule, update the trajectory's data
+        if position is None or position >= len(self.trajectory):
+            self.trajectory.append(child.molecule)
         else:
-            # This should never happen due to the _can_add_child check, but just in case
-            raise NotImplementedError(
-                "Only MoleculeObjects can be added as children to TrajectoryObject")
+            self.trajectory.insert(position, child.molecule)
 
         if send_signals and self._signals:
-            self._signals.node_added.emit(child.uuid)
-            self._signals.tree_structure_changed.emit()
+            self._announce_added(child)
 
         return success, msg
 
     def remove_child(self, child: SceneObject, send_signals: bool = True):
         """Remove child and also update the trajectory data"""
 
+        if self._children.get(child.uuid) is not child:
+            return None
+
+        # Frames normally sit at the image index recorded for their node, so
+        # check there before falling back to a scan of the trajectory
+        position = self.index_of(child)
+        frame_index = self._image_index(position)
+        if not (frame_index < len(self.trajectory) and self.trajectory[frame_index] is child.molecule):
+            frame_index = next((i for i, molecule in enumerate(self.trajectory)
+                                if molecule is child.molecule), None)
+
         child = super().remove_child(child, send_signals=False)
 
-        # Find the index of the child in the trajectory
-        for i, molecule in enumerate(self.trajectory):
-            if molecule is child.molecule:
-                self.trajectory.remove_image(i)
-                break
+        if frame_index is not None:
+            self.trajectory.remove_image(frame_index)
+        if self._image_indices is not None:
+            # Later images moved down by one
+            del self._image_indices[position]
+            if frame_index is not None:
+                self._image_indices[position:] = [
+                    i - 1 if i > frame_index else i for i in self._image_indices[position:]]
 
         if send_signals and self._signals:
-            self._signals.node_removed.emit(child.uuid)
-            self._signals.tree_structure_changed.emit()
+            self._announce_removed(child.uuid)
 
         return child
 
+    def remove_children(self, children: List[SceneObject], send_signals: bool = True) -> List[SceneObject]:
+        """
+        Remove several frames and their trajectory images in one pass
+
+        Unlike calling remove_child in a loop, the trajectory is scanned once
+        and images are removed from the end, so no image is shifted twice.
+        """
+        children = [child for child in children
+                    if self._children.get(child.uuid) is child]
+        if not children:
+            return []
+
+        dropped = {id(child.molecule) for child in children}
+        images = getattr(self.trajectory, 'images', None)
+        if isinstance(images, list):
+            images[:] = [image for image in images if id(image) not in dropped]
+        else:
+            indices = [i for i, molecule in enumerate(self.trajectory)
+                       if id(molecule) in dropped]
+            for i in reversed(indices):
+                self.trajectory.remove_image(i)
+
+        if self._image_indices is not None:
+            # Look up the shifted image index of every remaining frame
+            image_indices = {id(molecule): i for i,
+                             molecule in enumerate(self.trajectory)}
+            removed_uuids = {child.uuid for child in children}
+            self._image_indices = [image_indices[id(frame.molecule)]
+                                   for frame in self._children.values()
+                                   if frame.uuid not in removed_uuids]
+
+        return super().remove_children(children, send_signals=send_signals)
+
     def reorder_child(self, child: SceneObject, new_position: int, send_signals=True):
         """Reorder the child with the given UUID to the new position"""
 
+        if child.uuid not in self._children:
+            return False, "Child does not belong to this parent"
+        if self.is_sparse:
+            # Frame positions do not match image positions until every
+            # frame exists
+            logger.warning(
+                f"Cannot reorder frames of sparse trajectory {self.name}")
+            return False, f'Load all frames of {self.name} before reordering frames'
+        # Frames are stored in the same order as the children
+        old_position = self.index_of(child)
+
         success, msg = super().reorder_child(child, new_position, send_signals=False)
         if not success:
             return success, msg
-
-        # Get current positions of molecules
-        children_list = list(self._children.values())
-        old_position = children_list.index(child)
+        new_position = self.index_of(child)
+        if old_position == new_position:
+            return success, msg
 
         # Update trajectory data order
-        molecule = self.trajectory[old_position]
-        self.trajectory.remove_image(old_position)
-        self.trajectory.insert(new_position, molecule)
+        self._move_frame(old_position, new_position)
 
         if send_signals and self._signals:
-            self._signals.tree_structure_changed.emit()
+            self._signals.announce_structure_changed()
 
         return True, f'Successfully reordered {child.name} to position {new_position}'
 
+    def clear(self, send_signals: bool = True) -> List[SceneObject]:
+        """Remove all frames and the trajectory data in one pass"""
+        removed = self.children
+        self._on_subtrees_detached(removed)
+        for child in removed:
+            child._parent = None
+            child._invalidate_path_cache()
+        self._children.clear()
+        self._child_names.clear()
+        self._positions = None
+        self._active_index = 0
+        self._stride = 1
+        self._image_indices = None
+
+        images = getattr(self.trajectory, 'images', None)
+        if isinstance(images, list):
+            images.clear()
+        else:
+            for i in reversed(range(len(self.trajectory))):
+                self.trajectory.remove_image(i)
+
+        if send_signals and self._signals and removed:
+            with self._signals.batch_structure_changes():
+                for child in removed:
+                    self._signals.announce_removed(child.uuid)
+
+        return removed
+
+    def _move_frame(self, old_position: int, new_position: int):
+        """Move a frame within the trajectory data"""
+        images = getattr(self.trajectory, 'images', None)
+        if isinstance(images, list):
+            # Single pop/insert on the backing list
+            images.insert(new_position, images.pop(old_position))
+        else:
+            molecule = self.trajectory[old_position]
+            self.trajectory.remove_image(old_position)
+            self.trajectory.insert(new_position, molecule)
+
     @classmethod
-    def from_trajectory(cls, trajectory, name, parent=None, visible=True, signals: Optional[TreeSignals] = None, send_signals=True) -> 'TrajectoryObject':
+    def from_trajectory(cls, trajectory, name, parent=None, visible=True, signals: Optional[TreeSignals] = None, stride: int = 1) -> 'TrajectoryObject':
+        """
+        Create a trajectory object with a frame node per image
+
+        With stride > 1 only every stride-th image gets a frame node, which
+        keeps loading long trajectories fast; load_all_frames() creates the
+        remaining ones, and indexing the object creates a single one.
+        """
+        if stride < 1:
+            raise ValueError(f"Stride must be at least 1, got {stride}")
         logger.info(
-            f"Creating trajectory {name} object with {len(trajectory)} frames")
+            f"Creating trajectory {name} object with {len(trajectory)} frames (stride {stride})")
         trajectory_object = cls(name, trajectory, parent, visible, signals)
-        # Create molecule objects for each frame
-        for i, image in enumerate(trajectory):
-            image_name = f'Frame_{i}'
-            logger.debug(
-                f"Creating molecule object for {image_name} with signals {signals}")
-            molecule_object = MoleculeObject.from_molecule(
-                molecule=image, name=image_name, parent=trajectory_object, visible=i == 0, signals=signals, send_signals=False)
-            trajectory_object._children[molecule_object.uuid] = molecule_object
-
-        if send_signals and trajectory_object._signals:
-            trajectory_object._signals.tree_structure_changed.emit()
+        image_indices = list(range(0, len(trajectory), stride))
+        if len(image_indices) < len(trajectory):
+            trajectory_object._stride = stride
+            trajectory_object._image_indices = image_indices
+        # Create molecule objects for each sampled frame
+        trajectory_object._attach_children([
+            trajectory_object._create_frame(i, visible=i == 0)
+            for i in image_indices
+        ])
+        # The frames are announced with a single nodes_added once the
+        # trajectory is attached to the tree
 
         return trajectory_object
 
     @classmethod
-    def from_xyz_file(cls, path, name: Optional[str] = None, parent=None, visible=True, signals: Optional[TreeSignals] = None, send_signals=True) -> 'TrajectoryObject':
+    def from_xyz_file(cls, path, name: Optional[str] = None, parent=None, visible=True, signals: Optional[TreeSignals] = None, stride: int = 1) -> 'TrajectoryObject':
         trajectory = Trajectory.load(path)
 
         logger.info(f"Loaded trajectory with {len(trajectory)} frames")
@@ -268,4 +722,4 @@ class TrajectoryObject(SceneObject):
         if name is None:
             name = pathlib.Path(path).stem
 
-        return cls.from_trajectory(trajectory, name,  parent, visible, signals, send_signals=send_signals)
+        return cls.from_trajectory(trajectory, name,  parent, visible, signals, stride=stride)
@@ -1,5 +1,11 @@
+import functools
+import itertools
+import os
+import sys
+import threading
 import uuid
-from typing import Optional, Dict, List, Iterator, Tuple, Any, TypeVar, Generic, Union
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Iterable, Iterator, Tuple, Any, TypeVar, Generic, Union
 from dataclasses import dataclass, field
 from PyQt5.QtCore import QObject, pyqtSignal
 import logging
@@ -8,24 +14,102 @@ from .renderer.render_settings import RenderSettings
 # Create logger
 logger = logging.getLogger("chemvista.tree")
 
+# Branch and continuation strings used by format_tree
+_BRANCH_LAST = "└── "
+_BRANCH_MID = "├── "
+_PREFIX_LAST = "    "
+_PREFIX_MID = "│   "
+
+
+def move_dict_key(d: dict, key, new_index: int) -> None:
+    """Move key to new_index in d in place, without copying the whole dict"""
+    value = d.pop(key)
+    tail = list(itertools.islice(d, new_index, None))
+    d[key] = value
+    # Re-inserting a key appends it, so cycle the keys that belong after it
+    for k in tail:
+        d[k] = d.pop(k)
+
+
+class _UuidPool:
+    """Hand out random UUID4 strings from a block of os.urandom bytes
+
+    Reading the randomness for many uuids at once avoids one urandom call per
+    node when large trajectories are built.
+    """
+    BLOCK_SIZE = 4096
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+
+    def next_uuid(self) -> str:
+        with self._lock:
+            if self._offset >= len(self._buffer):
+                self._buffer = os.urandom(16 * self.BLOCK_SIZE)
+                self._offset = 0
+            raw = self._buffer[self._offset:self._offset + 16]
+            self._offset += 16
+        return str(uuid.UUID(bytes=raw, version=4))
+
+
+_UUID_POOL = _UuidPool()
+
+
+def _unindex_node(index: Dict[str, Dict[str, 'TreeNode']], key: str, node: 'TreeNode') -> None:
+    """Remove node from its bucket in a name or type index, dropping empty buckets"""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(node.uuid, None)
+        if not bucket:
+            del index[key]
+
+
 T = TypeVar('T')  # Generic type for node data
 
 
-@dataclass
+@functools.lru_cache(maxsize=1024)
+def _parse_path(path_str: str) -> Tuple[str, ...]:
+    """Split a path string into its parts, ignoring empty segments"""
+    return tuple(part for part in path_str.split('/') if part)
+
+
+@dataclass(frozen=True, slots=True)
 class NodePath:
-    """Represents a path to a node in the tree"""
-    parts: List[str] = field(default_factory=list)
+    """Represents a path to a node in the tree
+
+    Paths are shared between node path caches, so parts is kept as a tuple
+    (any iterable passed in is converted); the string form and the hash are
+    cached on first use, which makes paths cheap to use as dict keys.
+    """
+    parts: Tuple[str, ...] = ()
+    _string: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.parts, tuple):
+            object.__setattr__(self, 'parts', tuple(self.parts))
 
     def __str__(self) -> str:
-        return '/' + '/'.join(self.parts)
+        if self._string is None:
+            object.__setattr__(self, '_string', '/' + '/'.join(self.parts))
+        return self._string
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(self.parts))
+        return self._hash
 
     @classmethod
     def from_string(cls, path_str: str) -> 'NodePath':
-        return cls(path_str.strip('/').split('/'))
+        return cls(_parse_path(path_str))
 
     def child(self, name: str) -> 'NodePath':
         """Return a new path with the given name appended"""
-        return NodePath(self.parts + [name])
+        return NodePath(self.parts + (name,))
 
     def parent(self) -> Optional['NodePath']:
         """Return the parent path or None if this is the root"""
@@ -44,30 +128,133 @@ class NodePath:
 class TreeSignals(QObject):
     """Signals for tree events to avoid multiple inheritance issues"""
     node_added = pyqtSignal(str)  # emits node UUID
+    # emits the UUIDs of children built in bulk (e.g. trajectory frames)
+    nodes_added = pyqtSignal(list)
     node_removed = pyqtSignal(str)  # emits node UUID
     node_changed = pyqtSignal(str)  # emits node UUID
     # emits node UUID and visibility state
     visibility_changed = pyqtSignal(str, bool)
+    # emits (UUID, visibility) pairs for a subtree changed in one go
+    visibilities_changed = pyqtSignal(list)
 
     render_changed = pyqtSignal(str)  # emits when render settings change
 
     # emits when tree structure changes (moves, etc)
     tree_structure_changed = pyqtSignal()
 
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # Nesting depth of batch_structure_changes and the changes it holds back
+        self._batch_depth = 0
+        self._pending_added: List[str] = []
+        self._pending_removed: List[str] = []
+        self._pending_structure = False
+
+    def announce_added(self, node_uuid: str, descendants: Optional[List[str]] = None) -> None:
+        """
+        Emit node_added and tree_structure_changed, or hold them while batching
+
+        The uuids of nodes that entered the tree below the added one are
+        reported with a single nodes_added in between.
+        """
+        if self._batch_depth:
+            self._pending_added.append(node_uuid)
+            if descendants:
+                self._pending_added.extend(descendants)
+            return
+        self.node_added.emit(node_uuid)
+        if descendants:
+            self.nodes_added.emit(descendants)
+        self.tree_structure_changed.emit()
+
+    def announce_bulk_added(self, uuids: List[str]) -> None:
+        """Emit nodes_added and tree_structure_changed, or hold them while batching"""
+        if self._batch_depth:
+            self._pending_added.extend(uuids)
+            return
+        self.nodes_added.emit(uuids)
+        self.tree_structure_changed.emit()
+
+    def announce_removed(self, node_uuid: str) -> None:
+        """Emit node_removed and tree_structure_changed, or hold them while batching"""
+        if self._batch_depth:
+            self._pending_removed.append(node_uuid)
+            return
+        self.node_removed.emit(node_uuid)
+        self.tree_structure_changed.emit()
+
+    def announce_structure_changed(self) -> None:
+        """Emit tree_structure_changed, or hold it while batching"""
+        if self._batch_depth:
+            self._pending_structure = True
+            return
+        self.tree_structure_changed.emit()
+
+    @contextmanager
+    def batch_structure_changes(self):
+        """
+        Hold back the structure signals of every node using these signals
+
+        When the outermost block exits, additions are reported with one
+        nodes_added signal, removals with their node_removed signals, and a
+        single tree_structure_changed follows.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                added, self._pending_added = self._pending_added, []
+                removed, self._pending_removed = self._pending_removed, []
+                structure, self._pending_structure = self._pending_structure, False
+                if added:
+                    self.nodes_added.emit(added)
+                for node_uuid in removed:
+                    self.node_removed.emit(node_uuid)
+                if added or removed or structure:
+                    self.tree_structure_changed.emit()
+
 
 class TreeNode(Generic[T]):
     """Base class for all tree nodes with efficient operations"""
+    __slots__ = ('_name', 'data', 'node_type', 'uuid', '_visible', '_parent',
+                 '_children', '_child_names', '_positions', '_path_cache',
+                 '_uuid_index', '_name_index', '_type_index', '_signals',
+                 '_subtree_size')
+
+    # Whether hiding this node also hides its whole subtree in iter_visible
+    PROPAGATE_VISIBILITY = False
+
+    # Key of the renderer that draws this node, None for nodes not drawn
+    RENDER_KIND: Optional[str] = None
 
     def __init__(self, name: str, data: Optional[T] = None, node_type: str = "generic",
                  parent: Optional['TreeNode'] = None, visible: bool = True, signals=None):
-        self._name = name  # Use private attribute for name
+        # Names and types repeat across many nodes (frames, fields), interning
+        # shares one string per value and lets comparisons hit on identity
+        self._name = sys.intern(name)
         self.data = data
-        self.node_type = node_type
-        self.uuid = str(uuid.uuid4())
+        self.node_type = sys.intern(node_type)
+        self.uuid = _UUID_POOL.next_uuid()
         self._visible = visible
         self._parent = parent
         self._children: Dict[str, 'TreeNode'] = {}
-        self._path_cache: Optional[NodePath] = None
+        # Children carrying each name, for O(1) duplicate checks and lookups
+        self._child_names: Dict[str, List['TreeNode']] = {}
+        # Lazily built uuid -> index map, dropped whenever the order changes
+        self._positions: Optional[Dict[str, int]] = None
+        # (parent path it was built from, path); stale once the parent's differs
+        self._path_cache: Optional[Tuple[Optional[NodePath], NodePath]] = None
+        # uuid -> node for the whole tree, built on the top node at the first
+        # lookup and kept up to date as subtrees are attached and detached
+        self._uuid_index: Optional[Dict[str, 'TreeNode']] = None
+        # name -> {uuid: node}, built and maintained the same way
+        self._name_index: Optional[Dict[str, Dict[str, 'TreeNode']]] = None
+        # node_type -> {uuid: node}, built and maintained the same way
+        self._type_index: Optional[Dict[str, Dict[str, 'TreeNode']]] = None
+        # Number of nodes in the subtree rooted here, this node included
+        self._subtree_size = 1
         self._signals = None
         self.signals = signals
 
@@ -79,10 +266,12 @@ class TreeNode(Generic[T]):
     @visible.setter
     def visible(self, value: bool):
         """Set visibility state"""
+        if value == self._visible:
+            return
         self._visible = value
         if self.signals:
             self._signals.visibility_changed.emit(self.uuid, value)
-            self._signals.tree_structure_changed.emit()
+            self._signals.announce_structure_changed()
             self._signals.render_changed.emit(self.uuid)
 
     @property
@@ -103,9 +292,22 @@ class TreeNode(Generic[T]):
     @name.setter
     def name(self, value: str):
         """Set node name and invalidate path cache"""
+        value = sys.intern(value)
+        if self._parent is not None and self._parent._children.get(self.uuid) is self:
+            self._parent._forget_child_name(self._name, self)
+            self._parent._remember_child_name(value, self)
+        name_index = self._top()._name_index
+        if name_index is not None:
+            _unindex_node(name_index, self._name, self)
+            name_index.setdefault(value, {})[self.uuid] = self
         self._name = value
         self._invalidate_path_cache()
 
+    @property
+    def subtree_size(self) -> int:
+        """Number of nodes in the subtree rooted at this node, itself included"""
+        return self._subtree_size
+
     @property
     def parent(self) -> Optional['TreeNode']:
         """Get the parent node"""
@@ -114,19 +316,23 @@ class TreeNode(Generic[T]):
     @parent.setter
     def parent(self, new_parent: Optional['TreeNode']):
         """Set the parent node with proper cleanup"""
-        # Remove from old parent if exists
-        if self._parent and self in self._parent._children.values():
-            self._parent.remove_child(self, send_signals=False)
+        if new_parent is not None and self._is_ancestor_of(new_parent):
+            raise ValueError(
+                f"Cannot make {new_parent.name} the parent of its ancestor {self.name}")
+        old_parent = self._attached_parent()
+        # Already a child of new_parent, nothing to move
+        if new_parent is not None and old_parent is new_parent:
+            return
 
-        # Set new parent
-        self._parent = new_parent
-
-        # Add to new parent's children if it exists
-        if new_parent:
-            new_parent.add_child(self, send_signals=False)
+        # Remove from old parent if exists
+        if old_parent is not None:
+            old_parent.remove_child(self, send_signals=False)
 
-        # Invalidate path cache
-        self._invalidate_path_cache()
+        # Attaching sets the parent reference and invalidates the path cache;
+        # a node left unattached still keeps the reference it was given
+        if new_parent is None or not new_parent.add_child(self, send_signals=False)[0]:
+            self._parent = new_parent
+            self._invalidate_path_cache()
 
         # Call hook for subclasses to handle parent change
         self._on_parent_changed()
@@ -140,28 +346,192 @@ class TreeNode(Generic[T]):
         """Get list of first level children"""
         return list(self._children.values())
 
+    def iter_children(self) -> Iterator['TreeNode']:
+        """Iterate over first level children without copying them into a list"""
+        return iter(self._children.values())
+
     @property
     def path(self) -> NodePath:
         """Get path to this node"""
-        if self._path_cache is None:
-            parts = []
-            current = self
-            while current is not None:
-                parts.append(current.name)
-                current = current._parent
-            self._path_cache = NodePath(list(reversed(parts)))
-        return self._path_cache
+        # Build on the parent's cached path, so paths of a whole subtree are
+        # computed with one step per node rather than one per level. The
+        # cache is checked against the parent's current path object, which
+        # lets a rename or move invalidate only the node itself.
+        parent_path = self._parent.path if self._parent is not None else None
+        return self._path_under(parent_path)
+
+    def _path_under(self, parent_path: Optional[NodePath]) -> NodePath:
+        """Path of this node given its parent's current path, cached like path"""
+        cache = self._path_cache
+        if cache is None or cache[0] is not parent_path:
+            if parent_path is None:
+                path = NodePath((self._name,))
+            else:
+                path = parent_path.child(self._name)
+            self._path_cache = cache = (parent_path, path)
+        return cache[1]
+
+    def _remember_child_name(self, name: str, child: 'TreeNode'):
+        nodes = self._child_names.get(name)
+        if nodes is None:
+            self._child_names[name] = [child]
+        else:
+            nodes.append(child)
+
+    def _forget_child_name(self, name: str, child: 'TreeNode'):
+        nodes = self._child_names.get(name)
+        if nodes is None:
+            return
+        if len(nodes) == 1:
+            del self._child_names[name]
+        else:
+            nodes.remove(child)
+
+    def has_child_named(self, name: str) -> bool:
+        """Check whether a direct child with the given name exists"""
+        return name in self._child_names
+
+    def get_child_by_name(self, name: str) -> Optional['TreeNode']:
+        """Get the first direct child with the given name, or None"""
+        nodes = self._child_names.get(name)
+        if nodes is None:
+            return None
+        if len(nodes) == 1:
+            return nodes[0]
+        # Several siblings share the name, the first one in child order wins
+        return next(child for child in self._children.values() if child.name == name)
+
+    def _attach_child(self, child: 'TreeNode'):
+        """Append a child without checks or signals, used for bulk construction"""
+        child._parent = self
+        self._children[child.uuid] = child
+        self._remember_child_name(child.name, child)
+        if self._positions is not None:
+            self._positions[child.uuid] = len(self._children) - 1
+        self._on_subtrees_attached([child])
+
+    def _attach_children(self, children: List['TreeNode']):
+        """Append several children at once without checks or signals"""
+        for child in children:
+            child._parent = self
+            self._remember_child_name(child.name, child)
+        self._children.update((child.uuid, child) for child in children)
+        self._positions = None
+        self._on_subtrees_attached(children)
+
+    def _attached_parent(self) -> Optional['TreeNode']:
+        """The parent, if this node is already one of its children
+
+        Nodes may be created with a parent they are only attached to later.
+        """
+        parent = self._parent
+        if parent is not None and parent._children.get(self.uuid) is self:
+            return parent
+        return None
+
+    def _top(self) -> 'TreeNode':
+        """The topmost ancestor of this node, which owns the uuid index"""
+        node = self
+        while (parent := node._attached_parent()) is not None:
+            node = parent
+        return node
+
+    def _add_subtree_size(self, delta: int) -> 'TreeNode':
+        """Adjust the subtree size of this node and its ancestors, returns the topmost one"""
+        node = self
+        while True:
+            node._subtree_size += delta
+            parent = node._attached_parent()
+            if parent is None:
+                return node
+            node = parent
+
+    def _on_subtrees_attached(self, children: List['TreeNode']):
+        """Account for attached subtrees in subtree sizes and the tree indexes"""
+        top = self._add_subtree_size(
+            sum(child._subtree_size for child in children))
+        index, name_index, type_index = top._uuid_index, top._name_index, top._type_index
+        for child in children:
+            if index is not None:
+                if child._uuid_index is not None:
+                    index.update(child._uuid_index)
+                else:
+                    index.update((node.uuid, node)
+                                 for node in child.iter_nodes())
+            if name_index is not None or type_index is not None:
+                for node in child.iter_nodes():
+                    if name_index is not None:
+                        name_index.setdefault(node._name, {})[node.uuid] = node
+                    if type_index is not None:
+                        type_index.setdefault(node.node_type, {})[
+                            node.uuid] = node
+            child._uuid_index = None
+            child._name_index = None
+            child._type_index = None
+
+    def _on_subtrees_detached(self, children: List['TreeNode']):
+        """Account for subtrees about to be detached in subtree sizes and the tree indexes"""
+        top = self._add_subtree_size(
+            -sum(child._subtree_size for child in children))
+        index, name_index, type_index = top._uuid_index, top._name_index, top._type_index
+        if index is None and name_index is None and type_index is None:
+            return
+        for child in children:
+            for node in child.iter_nodes():
+                if index is not None:
+                    index.pop(node.uuid, None)
+                if name_index is not None:
+                    _unindex_node(name_index, node._name, node)
+                if type_index is not None:
+                    _unindex_node(type_index, node.node_type, node)
+
+    def index_of(self, child: 'TreeNode') -> int:
+        """Position of a direct child, raises KeyError if it is not a child"""
+        if self._positions is None:
+            self._positions = {uuid: i for i,
+                               uuid in enumerate(self._children)}
+        return self._positions[child.uuid]
 
     def _invalidate_path_cache(self):
-        """Invalidate path cache for this node and all children"""
+        """Invalidate the path cache of this node and, through it, its subtree"""
+        # Descendants notice the new path object of this node on their next
+        # access, so there is no need to visit them here
         self._path_cache = None
-        for child in self._children.values():
-            child._invalidate_path_cache()
 
     def _can_add_child(self, child: 'TreeNode') -> Tuple[bool, str]:
         """Check if a child can be added - subclasses can override to restrict by type"""
         return True, ""
 
+    def _announce_added(self, child: 'TreeNode') -> None:
+        """Emit the signals for a child subtree added to this node, or hold them while batching"""
+        descendants = None
+        if child._subtree_size > 1:
+            # Nodes built below the child before it was attached enter the
+            # tree only now
+            nodes = child.iter_nodes()
+            next(nodes)
+            descendants = [node.uuid for node in nodes]
+        self._signals.announce_added(child.uuid, descendants)
+
+    def _announce_removed(self, uuid: str) -> None:
+        """Emit the signals for a child removed from this node, or hold them while batching"""
+        self._signals.announce_removed(uuid)
+
+    @contextmanager
+    def batch_structure_changes(self):
+        """
+        Hold back the structure signals of this node's tree until the block exits
+
+        Batching happens on the signals object, so changes anywhere in the
+        tree, or in objects built for it meanwhile, are coalesced as well.
+        See TreeSignals.batch_structure_changes.
+        """
+        if self._signals is None:
+            yield self
+            return
+        with self._signals.batch_structure_changes():
+            yield self
+
     def add_child(self, child: 'TreeNode', position: Optional[int] = None, send_signals: bool = True) -> Tuple[bool, str]:
         """
         Add a child to this node with optional position, returns success and message
@@ -174,7 +544,12 @@ class TreeNode(Generic[T]):
         Returns:
             Tuple of (success: bool, message: str)
         """
-        logger.debug(f"Adding child {child.name} to {self.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Adding child {child.name} to {self.name}")
+
+        # A node cannot become its own descendant
+        if child._is_ancestor_of(self):
+            return False, "Cannot add a node to itself or its descendants"
 
         # Check if child can be added (allow subclasses to restrict by type)
         can_add, msg = self._can_add_child(child)
@@ -187,82 +562,100 @@ class TreeNode(Generic[T]):
             if child.uuid in self._children:
                 return False, "Child already exists in this parent"
 
-            child._parent = self
-            self._children[child.uuid] = child
+            self._attach_child(child)
             child._invalidate_path_cache()
 
             # Emit signals if requested
             if send_signals and self._signals:
-                self._signals.node_added.emit(child.uuid)
-                self._signals.tree_structure_changed.emit()
+                self._announce_added(child)
 
             return True, "Node added"
 
         # Handle positioned add
-        children_list = list(self._children.values())
-        if 0 <= position <= len(children_list):
+        if 0 <= position <= len(self._children):
             # First check if child is already in children
             if child.uuid in self._children:
                 return False, "Child already exists in this parent"
 
             # Add the child
-            child._parent = self
-            self._children[child.uuid] = child
+            self._attach_child(child)
             child._invalidate_path_cache()
 
-            # Then reorder by rebuilding the list and dictionary
-            children_list = list(self._children.values())
-            # Remove and reinsert at the right position
-            children_list.remove(child)
-            children_list.insert(position, child)
-
-            # Rebuild dictionary to maintain order
-            self._children = {node.uuid: node for node in children_list}
+            # Then move it from the end to the requested position
+            move_dict_key(self._children, child.uuid, position)
+            self._positions = None
 
             # Emit signals if requested
             if send_signals and self._signals:
-                self._signals.node_added.emit(child.uuid)
-                self._signals.tree_structure_changed.emit()
+                self._announce_added(child)
 
             return True, f"Node added at position {position}"
 
         return False, f"Invalid position {position}"
 
-    def remove_child(self, child: Union['TreeNode', str], send_signals: bool = True) -> Optional['TreeNode']:
+    def remove_child(self, child: 'TreeNode', send_signals: bool = True) -> Optional['TreeNode']:
         """
         Remove a child from this node, returns the removed child or None if not found
 
         Args:
-            child: The child node or its UUID to remove
+            child: The child node to remove
             send_signals: Whether to emit signals after the operation (default: True)
 
         Returns:
             The removed TreeNode or None if not found
         """
-        # Handle string UUID as argument
-        if isinstance(child, str):
-            child_obj = self._children.get(child)
-            if not child_obj:
-                return None
-            child = child_obj
-
         # Check if the child exists in our children dictionary
-        if child.uuid not in self._children:
+        if self._children.get(child.uuid) is not child:
             return None
 
         # Remove from children
+        self._on_subtrees_detached([child])
         del self._children[child.uuid]
+        self._positions = None
+        self._forget_child_name(child.name, child)
 
         # Remove parent reference
         child._parent = None
+        child._invalidate_path_cache()
 
         # Emit signals if requested and signals object exists
-        if send_signals and self._signals and hasattr(child, 'uuid'):
-            self._signals.node_removed.emit(child.uuid)
-            self._signals.tree_structure_changed.emit()
+        if send_signals and self._signals:
+            self._announce_removed(child.uuid)
 
         return child
 
+    def remove_children(self, children: List['TreeNode'], send_signals: bool = True) -> List['TreeNode']:
+        """
+        Remove several children at once, returns the ones that were removed
+
+        Children that do not belong to this node are skipped. Signals are
+        emitted once for the whole batch.
+        """
+        removed = [child for child in children
+                   if self._children.get(child.uuid) is child]
+        self._on_subtrees_detached(removed)
+        for child in removed:
+            del self._children[child.uuid]
+            self._forget_child_name(child.name, child)
+            child._parent = None
+            child._invalidate_path_cache()
+        if removed:
+            self._positions = None
+
+        if send_signals and self._signals and removed:
+            with self._signals.batch_structure_changes():
+                for child in removed:
+                    self._signals.announce_removed(child.uuid)
+
+        return removed
+
+    def remove_child_by_uuid(self, uuid: str, send_signals: bool = True) -> Optional['TreeNode']:
+        """Remove the direct child with the given UUID, returns it or None if not found"""
+        child = self._children.get(uuid)
+        if child is None:
+            return None
+        return self.remove_child(child, send_signals=send_signals)
+
     def move(self, child_obj: Union['TreeNode', str], new_parent: Union['TreeNode', 'str'],
              position: Optional[int] = None) -> Tuple[bool, str]:
         """Move a child to a new parent with optional position, returns success and message"""
@@ -280,14 +673,24 @@ class TreeNode(Generic[T]):
                 logger.warning(f"Parent node {new_parent} not found")
                 return False, "Parent node not found"
 
-        logger.debug(
-            f"Moving node {child_obj.name} ({child_obj.uuid}) to {new_parent.name} ({new_parent.uuid}) with position {position}")
-
-        if new_parent == current_parent:
+        # Only format the debug messages when they are actually logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
             logger.debug(
-                f"Node {child_obj.name} already belongs to target parent {new_parent.name}, reordering instead of moving")
+                f"Moving node {child_obj.name} ({child_obj.uuid}) to {new_parent.name} ({new_parent.uuid}) with position {position}")
+
+        if new_parent is current_parent:
+            if debug:
+                logger.debug(
+                    f"Node {child_obj.name} already belongs to target parent {new_parent.name}, reordering instead of moving")
             return new_parent.reorder_child(child_obj, position)
 
+        # Check for cycles by walking up from the target, O(depth)
+        if child_obj._is_ancestor_of(new_parent):
+            logger.warning(
+                f"Cannot move node {child_obj.name} into its own subtree")
+            return False, "Cannot move a node into itself or its descendants"
+
         # Check if new parent can accept this child
         can_add, msg = new_parent._can_add_child(child_obj)
         if not can_add:
@@ -295,23 +698,33 @@ class TreeNode(Generic[T]):
                 f"Cannot move node to target: {msg}")
             return False, f"Cannot move to target: {msg}"
 
+        # Reject a bad position before unlinking, so a failed move leaves
+        # the node where it was
+        if position is not None and not 0 <= position <= len(new_parent._children):
+            logger.warning(f"Cannot move node to invalid position {position}")
+            return False, f"Failed to move node: Invalid position {position}"
+
         # Remove from current parent without sending signals
         if current_parent:
             current_parent.remove_child(child_obj, send_signals=False)
 
-        # Add to new parent
+        # Add to new parent; the subtree was already in the tree, so only the
+        # moved node itself is announced
         success, add_msg = new_parent.add_child(
-            child_obj, position, send_signals=True)
+            child_obj, position, send_signals=False)
 
         if success:
-            logger.debug(
-                f"Node {child_obj.name} moved successfully to {new_parent.name}")
-            logger.debug(f'{child_obj.parent = }')
-            logger.debug(
-                f'New parent children = {[child.name for child in new_parent.children]}')
-            logger.debug(
-                f'Old parent children = {[child.name for child in current_parent.children]}' if current_parent else 'No old parent')
-            logger.debug(self.format_tree())
+            if new_parent._signals:
+                new_parent._signals.announce_added(child_obj.uuid)
+            if debug:
+                logger.debug(
+                    f"Node {child_obj.name} moved successfully to {new_parent.name}")
+                logger.debug(f'{child_obj.parent = }')
+                logger.debug(
+                    f'New parent children = {[child.name for child in new_parent.children]}')
+                logger.debug(
+                    f'Old parent children = {[child.name for child in current_parent.children]}' if current_parent else 'No old parent')
+                logger.debug(self.format_tree())
             return success, f"Node moved successfully to {new_parent.name}"
 
         else:
@@ -332,26 +745,47 @@ class TreeNode(Generic[T]):
         # Set visibility
         if node.visible != visible:
             node.visible = visible
-            # Emit signal if exists
-            if self._signals:
+            # The setter already emitted through the node's own signals
+            if self._signals and node.signals is None:
                 self._signals.visibility_changed.emit(node.uuid, visible)
                 self._signals.render_changed.emit(node.uuid)
             return True
         return False
 
+    def set_subtree_visibility(self, visible: bool, send_signals: bool = True) -> List['TreeNode']:
+        """
+        Show or hide this node and all of its descendants, returns the changed nodes
+
+        Signals are emitted once for the whole subtree: visibilities_changed
+        with every changed node, then tree_structure_changed and render_changed.
+        """
+        changed = []
+        for node in self.iter_nodes():
+            if node._visible != visible:
+                # Flip the flag directly so the signals can be sent in bulk
+                node._visible = visible
+                changed.append(node)
+
+        if send_signals and self._signals and changed:
+            self._signals.visibilities_changed.emit(
+                [(node.uuid, visible) for node in changed])
+            self._signals.announce_structure_changed()
+            self._signals.render_changed.emit(self.uuid)
+
+        return changed
+
     def update_settings(self, settings: RenderSettings) -> None:
         """Update render settings for an object"""
-        logger.debug(
-            f"Updating settings for {self.name} with settings: {settings}")
+        # The settings repr covers every field, only build it when logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Updating settings for {self.name} with settings: {settings}")
         if hasattr(self, 'render_settings'):
             if settings != self.render_settings:
                 logger.debug(
                     f"Settings changed")
+                # The render_settings setter emits render_changed
                 self.render_settings = settings
-                if self._signals:
-                    logger.debug(
-                        f"Emitting render changed signal for {self.name}")
-                    self._signals.render_changed.emit(self.uuid)
             else:
                 logger.debug(
                     f"Settings unchanged for {self.name} as the settings are the same")
@@ -375,13 +809,8 @@ class TreeNode(Generic[T]):
         # Navigate down the tree
         current = self
         for part in path.parts[1:]:
-            found = False
-            for child in current.children:
-                if child.name == part:
-                    current = child
-                    found = True
-                    break
-            if not found:
+            current = current.get_child_by_name(part)
+            if current is None:
                 return None
 
         return current
@@ -389,39 +818,25 @@ class TreeNode(Generic[T]):
     def __contains__(self, item: Union[str, 'TreeNode', NodePath]) -> bool:
         """
         Check if a node exists in the tree. Supports:
+        - NodePath objects
         - Node objects directly
         - UUID strings
-        - NodePath objects or path strings
 
-        This allows for syntax like: `if node in tree` or `if uuid in tree`
+        Plain strings are always treated as UUIDs; wrap a path in NodePath to
+        look it up. This allows for syntax like: `if node in tree` or
+        `if uuid in tree`
         """
-        # Case 1: Check for TreeNode object directly
-        if isinstance(item, TreeNode):
-            # Check if this is the item
-            if item == self:
-                return True
-            # Check if it's a direct child
-            if item.uuid in self._children:
-                return True
-            # Recursively check children
-            return any(item in child for child in self.children)
+        # Case 1: Check for NodePath
+        if isinstance(item, NodePath):
+            return self.get_by_path(item) is not None
 
-        # Case 2: Check for UUID string
-        elif isinstance(item, str):
-            # Check if this node has the UUID
-            if self.uuid == item:
-                return True
-            # Check if it's a direct child
-            if item in self._children:
-                return True
-            # Recursively check children
-            return any(item in child for child in self.children)
+        # Case 2: Check for TreeNode object directly
+        elif isinstance(item, TreeNode):
+            return self._has_attached_descendant(item)
 
-        # Case 3: Check for NodePath
-        elif isinstance(item, (NodePath, str)):
-            path = item if isinstance(
-                item, NodePath) else NodePath.from_string(item)
-            return self.get_by_path(path) is not None
+        # Case 3: Check for UUID string
+        elif isinstance(item, str):
+            return self.get_object_by_uuid(item) is not None
 
         # Not found or unsupported type
         return False
@@ -436,22 +851,35 @@ class TreeNode(Generic[T]):
         Returns:
             The node with the matching UUID or None if not found
         """
-        # Check if this node has the UUID
-        if self.uuid == uuid_str:
-            return self
+        top = self._top()
+        if top._uuid_index is None:
+            top._uuid_index = {node.uuid: node for node in top.iter_nodes()}
+        node = top._uuid_index.get(uuid_str)
+
+        # The index covers the whole tree, only return nodes below this one
+        if node is None or top is self or self._is_ancestor_of(node):
+            return node
+        return None
 
-        # Check direct children first for performance
-        if uuid_str in self._children:
-            return self._children[uuid_str]
+    def _has_attached_descendant(self, node: 'TreeNode') -> bool:
+        """Check whether node is this node or actually attached below it
 
-        # Recursive search in children
-        for child in self.children:
-            result = child.get_object_by_uuid(uuid_str)
-            if result is not None:
-                return result
+        Unlike _is_ancestor_of, a node that only names a parent it was never
+        added to does not count.
+        """
+        while node is not None:
+            if node is self:
+                return True
+            node = node._attached_parent()
+        return False
 
-        # Not found
-        return None
+    def _is_ancestor_of(self, node: 'TreeNode') -> bool:
+        """Check whether node is this node or one of its descendants"""
+        while node is not None:
+            if node is self:
+                return True
+            node = node._parent
+        return False
 
     def get_object_by_name(self, name: str) -> Optional['TreeNode']:
         """
@@ -463,12 +891,20 @@ class TreeNode(Generic[T]):
         Returns:
             First node with matching name or None if not found
         """
-        # Check self first
-        if self.name == name:
-            return self
+        top = self._top()
+        if top._name_index is None:
+            top._name_index = {}
+            for node in top.iter_nodes():
+                top._name_index.setdefault(node._name, {})[node.uuid] = node
+        candidates = top._name_index.get(name)
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            node = next(iter(candidates.values()))
+            return node if self._is_ancestor_of(node) else None
 
-        # Search through all nodes in tree
-        for path, obj in self.iter_tree():
+        # Several nodes share the name, the first one in pre-order wins
+        for obj in self.iter_nodes():
             if obj.name == name:
                 return obj
 
@@ -484,59 +920,108 @@ class TreeNode(Generic[T]):
         Returns:
             List of nodes matching the specified type
         """
-        results = []
-
-        # Check self first
-        if self.node_type == obj_type:
-            results.append(self)
-
-        # Then search all descendants
-        for path, obj in self.iter_tree():
-            if obj != self and obj.node_type == obj_type:
-                results.append(obj)
-
-        return results
+        top = self._top()
+        if top._type_index is None:
+            top._type_index = {}
+            for node in top.iter_nodes():
+                top._type_index.setdefault(node.node_type, {})[
+                    node.uuid] = node
+        candidates = top._type_index.get(obj_type)
+        if not candidates:
+            return []
+
+        # The index covers the whole tree in attachment order, keep the nodes
+        # below this one and put them in pre-order (self first)
+        keyed = []
+        for node in candidates.values():
+            key = self._preorder_key(node)
+            if key is not None:
+                keyed.append((key, node))
+        keyed.sort(key=lambda item: item[0])
+        return [node for _, node in keyed]
+
+    def _preorder_key(self, node: 'TreeNode') -> Optional[Tuple[int, ...]]:
+        """Child positions leading from this node down to node, None if it is not below this one"""
+        positions = []
+        while node is not self:
+            parent = node._attached_parent()
+            if parent is None:
+                return None
+            positions.append(parent.index_of(node))
+            node = parent
+        positions.reverse()
+        return tuple(positions)
+
+    def iter_nodes(self) -> Iterator['TreeNode']:
+        """Iterate over all nodes in the tree (depth-first, pre-order) without building paths"""
+        # Explicit stack instead of recursive generators, which pay a frame
+        # per level for every yielded node
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node._children.values()))
 
     def iter_tree(self) -> Iterator[Tuple[NodePath, 'TreeNode']]:
-        """Iterate over all nodes in the tree"""
-        yield self.path, self
-        for child in self.children:
-            yield from child.iter_tree()
+        """Iterate over all nodes in the tree (depth-first, pre-order)"""
+        # Carry each node's path on the stack, so children extend it instead
+        # of walking back up to the root through the path property
+        stack = [(self, self.path)]
+        while stack:
+            node, path = stack.pop()
+            yield path, node
+            stack.extend((child, child._path_under(path))
+                         for child in reversed(node._children.values()))
+
+    def _visible_subtrees(self) -> Iterable['TreeNode']:
+        """Children whose subtrees may contain visible nodes - subclasses can override to prune
+
+        Must return a reversible collection, iter_visible pushes it in reverse.
+        """
+        return self._children.values()
 
     def iter_visible(self) -> Iterator['TreeNode']:
         """Iterate over all visible nodes in the tree"""
-        if self.visible:
-            yield self
-        for child in self.children:
-            yield from child.iter_visible()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.visible:
+                yield node
+            elif node.PROPAGATE_VISIBILITY:
+                # Nothing below a hidden node of this type is shown
+                continue
+            stack.extend(reversed(node._visible_subtrees()))
 
     def iter_invisible(self) -> Iterator['TreeNode']:
         """Iterate over all invisible nodes in the tree"""
-        if not self.visible:
-            yield self
-        for child in self.children:
-            yield from child.iter_invisible()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not node.visible:
+                yield node
+            stack.extend(reversed(node._children.values()))
+
+    def _format_detail(self) -> str:
+        """Extra annotation shown by format_tree - subclasses can override"""
+        return ""
 
     def format_tree(self, include_details: bool = True) -> str:
         """Create a string representation of the tree"""
         lines = ["Tree Structure:"]
 
-        def _print_node(node, prefix="", is_last=True):
+        # Explicit stack of (node, prefix, is_last) instead of recursion
+        stack = [(self, "", True)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+
             # Visibility indicator
             vis_indicator = "[✓]" if node.visible else "[✗]"
 
             # Create node representation
             type_label = node.node_type
 
-            # Determine details based on node attributes
-            detail = ""
-            if hasattr(node, 'is_directory') and node.is_directory:
-                if hasattr(node, 'is_trajectory') and node.is_trajectory:
-                    detail = f"[{len(node.children)} frames]" if hasattr(
-                        node, 'children') else ""
-                else:
-                    detail = f"[{len(node.children)} items]" if hasattr(
-                        node, 'children') else ""
+            # Determine details based on the node class
+            detail = node._format_detail()
 
             # Format the line
             node_text = f"{node.name} {vis_indicator} {type_label}"
@@ -545,17 +1030,15 @@ class TreeNode(Generic[T]):
             if include_details:
                 node_text += f" (id:{node.uuid[:8]}...)"
 
-            lines.append(f"{prefix}{'└── ' if is_last else '├── '}{node_text}")
-
-            # Process children
-            children = node.children
-            for i, child in enumerate(children):
-                _print_node(child,
-                            prefix + ("    " if is_last else '│   '),
-                            i == len(children) - 1)
+            lines.append(
+                f"{prefix}{_BRANCH_LAST if is_last else _BRANCH_MID}{node_text}")
 
-        # Start with root node
-        _print_node(self)
+            # Push children in reverse so they are printed in order
+            child_prefix = prefix + (_PREFIX_LAST if is_last else _PREFIX_MID)
+            last = True
+            for child in reversed(node._children.values()):
+                stack.append((child, child_prefix, last))
+                last = False
 
         # Fix: use proper string join
         return "\n".join(lines) if len(lines) > 1 else "Tree: < empty >"
@@ -577,30 +1060,27 @@ class TreeNode(Generic[T]):
         if child.uuid not in self._children:
             return False, "Child does not belong to this parent"
 
-        # Get current list of children
-        children_list = list(self._children.values())
-        new_position = new_position or len(children_list) - 1
+        n_children = len(self._children)
+        if new_position is None:
+            new_position = n_children - 1
 
         # Check if position is valid
-        if not (0 <= new_position < len(children_list)):
-            return False, f"Invalid position {new_position}, valid range is 0-{len(children_list)-1}"
+        if not (0 <= new_position < n_children):
+            return False, f"Invalid position {new_position}, valid range is 0-{n_children-1}"
 
         # Get current position
-        current_position = children_list.index(child)
+        current_position = self.index_of(child)
 
         # If position is the same, no change needed
         if current_position == new_position:
             return True, "Child already at requested position"
 
-        # Remove from current position and insert at new position
-        children_list.remove(child)
-        children_list.insert(new_position, child)
-
-        # Rebuild dictionary to maintain order
-        self._children = {node.uuid: node for node in children_list}
+        # Move within the children dictionary, keeping its order
+        move_dict_key(self._children, child.uuid, new_position)
+        self._positions = None
 
         # Emit signal if requested and signals object exists
         if send_signals and self._signals:
-            self._signals.tree_structure_changed.emit()
+            self._signals.announce_structure_changed()
 
         return True, f"Child moved from position {current_position} to {new_position}"
@@ -47,6 +47,8 @@ class MockQtInteractor(QWidget):
         self.close = MagicMock()
         self.reset_camera = MagicMock()
         self.set_background = MagicMock()
+        self.remove_actor = MagicMock()
+        self.bounds = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
 
 @pytest.fixture(scope="session")
@@ -1,8 +1,12 @@
 import pytest
 from PyQt5.QtWidgets import QApplication, QMessageBox, QDialog, QPushButton, QFileDialog, QAction
-from PyQt5.QtCore import Qt
-from PyQt5.QtTest import QTest
+from PyQt5.QtCore import Qt, QCoreApplication, QEventLoop
+from PyQt5.QtTest import QTest, QSignalSpy
 import pathlib
+import threading
+import time
+from unittest.mock import patch
+from chemvista.gui.loader import XyzLoadWorker
 from chemvista.gui.main_window import ChemVistaApp
 from chemvista.scene_manager import SceneManager
 
@@ -37,6 +41,8 @@ def app(qapp):
             self.close = MagicMock()
             self.reset_camera = MagicMock()
             self.set_background = MagicMock()
+            self.remove_actor = MagicMock()
+            self.bounds = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
     
     with patch('chemvista.gui.scene.QtInteractor', MockQtInteractor):
         app = ChemVistaApp()
@@ -62,3 +68,58 @@ def test_scene_manager_integration(app):
     assert app.scene_manager is not None
     assert isinstance(app.scene_manager, SceneManager)
     assert app.scene_manager.plotter == app.plotter
+
+
+def wait_until(condition, timeout=10.0):
+    """Process Qt events until condition() holds, fail after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for condition"
+        QCoreApplication.processEvents(QEventLoop.AllEvents, 50)
+
+
+@pytest.fixture
+def load_spies():
+    """Patch XyzLoadWorker so its signals are recorded before the worker starts"""
+    spies = {}
+
+    def make_worker(filepath):
+        worker = XyzLoadWorker(filepath)
+        spies['finished'] = QSignalSpy(worker.signals.finished)
+        spies['failed'] = QSignalSpy(worker.signals.failed)
+        return worker
+
+    with patch('chemvista.gui.main_window.XyzLoadWorker', side_effect=make_worker):
+        yield spies
+
+
+def test_load_xyz_async(app, test_files, load_spies):
+    """Test that a background XYZ load adds the object on the GUI thread"""
+    add_threads = []
+    original_add = app.scene_manager.add_xyz_data
+
+    def recording_add(trajectory, filepath):
+        add_threads.append(threading.current_thread())
+        return original_add(trajectory, filepath)
+
+    with patch.object(app.scene_manager, 'add_xyz_data', side_effect=recording_add):
+        app.load_xyz_async(test_files['xyz'])
+        assert len(app._pending_loads) == 1
+        wait_until(lambda: len(load_spies['finished']) == 1)
+        wait_until(lambda: not app._pending_loads)
+
+    assert len(load_spies['failed']) == 0
+    assert add_threads == [threading.main_thread()]
+    assert app.scene_manager.get_object_by_name(test_files['xyz'].stem) is not None
+
+
+def test_load_xyz_async_failure(app, tmp_path, load_spies):
+    """Test that a failed background XYZ load is reported and released"""
+    with patch.object(QMessageBox, 'critical') as critical:
+        app.load_xyz_async(tmp_path / 'missing.xyz')
+        wait_until(lambda: len(load_spies['failed']) == 1)
+        wait_until(lambda: not app._pending_loads)
+
+    assert len(load_spies['finished']) == 0
+    critical.assert_called_once()
+    assert len(app.scene_manager.root.children) == 0
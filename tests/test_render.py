@@ -0,0 +1,55 @@
+from chemvista.renderer import MoleculeRenderer
+from chemvista.renderer.base import settings_hash
+from chemvista.renderer.render_settings import MoleculeRenderSettings
+from nx_ase import Molecule
+
+
+def test_settings_hash_handles_nested_containers():
+    """Test that settings with dicts and lists can be hashed"""
+    settings = MoleculeRenderSettings(custom_colors={'C': [0, 0, 0]}).as_dict()
+    assert settings_hash(settings) == settings_hash(dict(settings))
+
+    changed = dict(settings, alpha=0.5)
+    assert settings_hash(settings) != settings_hash(changed)
+
+
+def test_render_settings_dict_cached_until_changed():
+    """Test that as_dict/hash_key are reused until a field is assigned"""
+    settings = MoleculeRenderSettings()
+    values = settings.as_dict()
+    key = settings.hash_key()
+    assert settings.as_dict() == values
+    assert key == settings_hash(values)
+
+    # Callers get a copy, editing it leaves the settings and hash alone
+    values['alpha'] = 0.25
+    assert settings.as_dict()['alpha'] == 1.0
+    assert settings.hash_key() == key
+
+    settings.alpha = 0.5
+    assert settings.as_dict()['alpha'] == 0.5
+    assert settings.hash_key() != key
+    assert settings == MoleculeRenderSettings(alpha=0.5)
+
+
+def test_molecule_meshes_reused_when_settings_unchanged(test_plotter, test_files):
+    """Test that meshes are only rebuilt when the settings change"""
+    renderer = MoleculeRenderer()
+    molecule = Molecule.load(test_files['molecule_2'])
+    settings = MoleculeRenderSettings().as_dict()
+
+    renderer.render(molecule, test_plotter, settings,
+                    cache_key='mol', settings_hash=settings_hash(settings))
+    first = renderer._mesh_cache['mol'][2]
+
+    renderer.render(molecule, test_plotter, settings,
+                    cache_key='mol', settings_hash=settings_hash(settings))
+    assert renderer._mesh_cache['mol'][2] is first
+
+    new_settings = dict(settings, resolution=10)
+    renderer.render(molecule, test_plotter, new_settings,
+                    cache_key='mol', settings_hash=settings_hash(new_settings))
+    assert renderer._mesh_cache['mol'][2] is not first
+
+    renderer.prune_cache([])
+    assert 'mol' not in renderer._mesh_cache
@@ -3,7 +3,7 @@ import pathlib
 import numpy as np
 from chemvista.scene_manager import SceneManager
 from chemvista.tree_structure import TreeNode, TreeSignals
-from nx_ase import Molecule, ScalarField
+from nx_ase import Molecule, ScalarField, Trajectory
 import pyvista as pv
 from PyQt5.QtCore import QObject
 from chemvista.scene_objects import (
@@ -11,6 +11,7 @@ from chemvista.scene_objects import (
 )
 from chemvista.renderer.render_settings import MoleculeRenderSettings
 import logging
+from unittest.mock import MagicMock
 
 
 @pytest.fixture
@@ -89,6 +90,54 @@ def test_render_scalar_field(scene: SceneManager, test_files, test_plotter):
     assert True
 
 
+def test_render_reuses_actors(scene: SceneManager, test_files, test_plotter):
+    """Test that unchanged objects keep their actors between renders"""
+    obj = scene.load_xyz(test_files['molecule_1'])
+    scene.render(test_plotter, reuse_actors=True)
+    actors = scene._actors[obj.uuid][2]
+    assert actors
+
+    scene.render(test_plotter, reuse_actors=True)
+    assert scene._actors[obj.uuid][2] is actors
+
+    obj.render_settings.alpha = 0.5
+    scene.render(test_plotter, reuse_actors=True)
+    assert scene._actors[obj.uuid][2] is not actors
+
+    obj.visible = False
+    scene.render(test_plotter, reuse_actors=True)
+    assert obj.uuid not in scene._actors
+
+
+def test_render_rebuilds_invalidated_molecule(scene: SceneManager, test_files, test_plotter):
+    """Test that editing a molecule in place and invalidating it rebuilds its actors"""
+    obj = scene.load_xyz(test_files['molecule_1'])
+    scene.render(test_plotter, reuse_actors=True)
+    actors = scene._actors[obj.uuid][2]
+
+    obj.molecule.positions += 10.0
+    obj.invalidate()
+    assert obj.revision == 1
+    scene.render(test_plotter, reuse_actors=True)
+    assert scene._actors[obj.uuid][2] is not actors
+
+
+def test_render_resets_camera_on_bounds_change(scene: SceneManager, test_files, test_plotter):
+    """Test that the camera is only reset when the scene extent changes"""
+    obj = scene.load_xyz(test_files['molecule_1'])
+    test_plotter.reset_camera = MagicMock()
+
+    scene.render(test_plotter, reuse_actors=True)
+    assert test_plotter.reset_camera.call_count == 1
+
+    scene.render(test_plotter, reuse_actors=True)
+    assert test_plotter.reset_camera.call_count == 1
+
+    obj.visible = False
+    scene.render(test_plotter, reuse_actors=True)
+    assert test_plotter.reset_camera.call_count == 2
+
+
 def test_settings_update(scene: SceneManager, test_files):
     """Test updating render settings"""
     obj = scene.load_xyz(test_files['molecule_1'])
@@ -135,6 +184,27 @@ def test_signals_emission(scene: SceneManager, signals, test_files):
     assert (obj.uuid, False) in visibility_signals
 
 
+def test_trajectory_frames_announced_in_bulk(signals, test_objects):
+    """Test that attaching a trajectory emits one bulk signal for all frames"""
+    root = TreeNode("root", signals=signals)
+    added, bulk_signals, structure_signals = [], [], []
+    signals.node_added.connect(added.append)
+    # Every announced node must already be reachable from the tree
+    signals.nodes_added.connect(lambda uuids: bulk_signals.append(
+        [root.get_object_by_uuid(uuid) for uuid in uuids]))
+    signals.tree_structure_changed.connect(
+        lambda: structure_signals.append(True))
+
+    traj_obj = TrajectoryObject.from_trajectory(
+        test_objects['trajectory'], "trajectory", signals=signals)
+    assert bulk_signals == [] and structure_signals == []
+
+    root.add_child(traj_obj)
+    assert added == [traj_obj.uuid]
+    assert bulk_signals == [traj_obj.children]
+    assert len(structure_signals) == 1
+
+
 class TestSceneManager:
     """Tests for the SceneManager class"""
 
@@ -189,6 +259,17 @@ class TestSceneManager:
             # If not a trajectory, it should be a molecule
             assert isinstance(obj, MoleculeObject)
 
+    def test_add_xyz_data(self, scene, test_files):
+        """Test adding an XYZ file that was parsed elsewhere"""
+        traj_path = test_files['trajectory']
+        path = Trajectory.load(traj_path)
+
+        obj = scene.add_xyz_data(path, traj_path)
+        assert isinstance(obj, TrajectoryObject)
+        assert obj.name == traj_path.stem
+        assert len(obj.children) == len(path)
+        assert obj in scene.root_objects
+
     def test_load_molecule_from_cube(self, scene, test_files):
         """Test loading molecule from cube file"""
         cube_file = test_files['scalar_filed_cube']
@@ -234,6 +315,24 @@ def test_load_trajectory(scene: SceneManager, test_files):
         assert isinstance(obj, MoleculeObject)
 
 
+def test_delete_object(scene: SceneManager, signals, test_files):
+    """Test deleting nested objects and whole subtrees"""
+    mol_obj = scene.load_molecule_from_cube(test_files['scalar_filed_cube'])
+    field_obj = mol_obj.children[0]
+    removed = []
+    signals.node_removed.connect(lambda uuid: removed.append(uuid))
+
+    scene.delete_object(field_obj.uuid)
+    assert field_obj not in mol_obj.children
+    assert removed == [field_obj.uuid]
+
+    traj_obj = scene.load_xyz(test_files['trajectory'])
+    scene.delete_object(traj_obj.uuid)
+    assert scene.get_object_by_uuid(traj_obj.uuid) is None
+    assert scene.get_object_by_uuid(traj_obj.children[0].uuid) is None
+    assert removed == [field_obj.uuid, traj_obj.uuid]
+
+
 def test_directory_creation_removed(scene):
     """Test that directory creation has been removed"""
     with pytest.raises(AttributeError):
@@ -260,6 +359,63 @@ def test_object_settings_update(scene: SceneManager, signals, test_files):
     assert obj.render_settings.alpha == 0.5
 
 
+def test_batch_render_emits_once(scene: SceneManager, signals, test_files):
+    """Test that settings changes inside batch_render emit a single signal"""
+    obj = scene.load_xyz(test_files['molecule_1'])
+
+    settings_changed = []
+    signals.render_changed.connect(lambda uuid: settings_changed.append(uuid))
+
+    with obj.batch_render():
+        obj.render_settings = MoleculeRenderSettings(alpha=0.5)
+        obj.render_settings = MoleculeRenderSettings(alpha=0.7)
+        assert settings_changed == []
+
+    assert settings_changed == [obj.uuid]
+    assert obj.render_settings.alpha == 0.7
+
+
+def test_batch_structure_changes(signals, test_objects):
+    """Test that children added in a batch are announced together"""
+    mol_obj = MoleculeObject(
+        "test_molecule", test_objects['molecule_1'], signals=signals)
+    fields = [ScalarFieldObject(name, test_objects['scalar_field'])
+              for name in ("a", "b", "c")]
+
+    added, bulk_added, structure_changes = [], [], []
+    signals.node_added.connect(added.append)
+    signals.nodes_added.connect(bulk_added.append)
+    signals.tree_structure_changed.connect(
+        lambda: structure_changes.append(True))
+
+    with mol_obj.batch_structure_changes():
+        for field in fields:
+            mol_obj.add_child(field)
+        assert bulk_added == [] and structure_changes == []
+
+    assert added == []
+    assert bulk_added == [[field.uuid for field in fields]]
+    assert len(structure_changes) == 1
+
+
+def test_bulk_update(scene: SceneManager, signals, test_files):
+    """Test that objects loaded in a bulk update are announced together"""
+    added, bulk_added, structure_changes = [], [], []
+    signals.node_added.connect(added.append)
+    signals.nodes_added.connect(bulk_added.append)
+    signals.tree_structure_changed.connect(
+        lambda: structure_changes.append(True))
+
+    with scene.bulk_update():
+        mol_obj = scene.load_xyz(test_files['molecule_1'])
+        field_obj = scene.load_scalar_field_from_cube(
+            test_files['scalar_filed_cube'])
+
+    assert added == []
+    assert bulk_added == [[mol_obj.uuid, field_obj.uuid]]
+    assert len(structure_changes) == 1
+
+
 def test_tree_formatting(scene: SceneManager, test_files):
     """Test tree formatting function"""
     # Load a molecule
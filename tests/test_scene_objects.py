@@ -1,4 +1,5 @@
 import pytest
+import shutil
 import numpy as np
 from PyQt5.QtCore import QObject
 from chemvista.scene_objects import (SceneObject, ScalarFieldObject, MoleculeObject, TrajectoryObject
@@ -101,6 +102,33 @@ class TestScalarFieldObject:
         assert hasattr(sf_obj, "scalar_field")
         assert sf_obj.node_type == "scalar_field"
 
+    def test_from_cube_file_lazy(self, test_files):
+        """Test that cube data is only read on first access"""
+        cube_path = test_files['scalar_filed_cube']
+
+        sf_obj = ScalarFieldObject.from_cube_file(cube_path, lazy=True)
+        assert not sf_obj.is_loaded
+
+        assert isinstance(sf_obj.scalar_field, ScalarField)
+        assert sf_obj.is_loaded
+        assert sf_obj.data is sf_obj.scalar_field
+
+        eager_obj = ScalarFieldObject.from_cube_file(cube_path, lazy=False)
+        assert eager_obj.is_loaded
+
+    def test_from_cube_file_lazy_malformed(self, tmp_path):
+        """Test that a bad lazily loaded cube yields no field instead of raising"""
+        cube_path = tmp_path / "broken.cube"
+        cube_path.write_text("not a cube file\n")
+
+        sf_obj = ScalarFieldObject.from_cube_file(cube_path, lazy=True)
+        assert sf_obj.scalar_field is None
+        assert sf_obj.vtk_grid is None
+        assert not sf_obj.is_loaded
+
+        with pytest.raises(Exception):
+            ScalarFieldObject.from_cube_file(cube_path, lazy=False)
+
 
 class TestMoleculeObject:
     """Tests for MoleculeObject class"""
@@ -119,6 +147,25 @@ class TestMoleculeObject:
         # Check render settings
         assert hasattr(mol_obj, "render_settings")
 
+    def test_molecule_atom_arrays_memoized(self, test_objects):
+        """Test that per-atom arrays are read once until invalidated"""
+        molecule = test_objects['molecule_1']
+        mol_obj = MoleculeObject("test_molecule", molecule)
+
+        positions = mol_obj.positions
+        assert mol_obj.positions is positions
+        assert mol_obj.chemical_symbols == molecule.get_chemical_symbols()
+        assert list(mol_obj.atomic_numbers) == list(molecule.get_atomic_numbers())
+
+        # In-place edits only show up after invalidate()
+        molecule.positions[0] += 1.0
+        assert mol_obj.positions is positions
+        revision = mol_obj.revision
+        mol_obj.invalidate()
+        assert mol_obj.revision == revision + 1
+        assert mol_obj.positions is not positions
+        assert (mol_obj.positions[0] == molecule.positions[0]).all()
+
     def test_molecule_scalar_field_children(self, test_objects):
         """Test adding scalar fields to molecules"""
         molecule = test_objects['molecule_1']
@@ -168,10 +215,26 @@ class TestMoleculeObject:
 
         # Test removing by UUID
         mol_obj.add_child(sf_obj)
-        removed = mol_obj.remove_child(sf_obj.uuid)
+        removed = mol_obj.remove_child_by_uuid(sf_obj.uuid)
         assert removed is sf_obj
         assert "density" not in mol_obj.molecule.scalar_fields
 
+    def test_reorder_scalar_fields(self, test_objects):
+        """Test that reordering children reorders the molecule's fields in place"""
+        molecule = test_objects['molecule_1']
+        scalar_field = test_objects['scalar_field']
+
+        mol_obj = MoleculeObject("test_molecule", molecule)
+        for name in ("a", "b", "c"):
+            mol_obj.add_child(ScalarFieldObject(name, scalar_field))
+        scalar_fields = mol_obj.molecule.scalar_fields
+
+        success, msg = mol_obj.reorder_child(mol_obj.children[0], 1)
+        assert success is True
+        assert [child.name for child in mol_obj.children] == ["b", "a", "c"]
+        assert list(mol_obj.molecule.scalar_fields) == ["b", "a", "c"]
+        assert mol_obj.molecule.scalar_fields is scalar_fields
+
     def test_from_xyz_file(self, test_files):
         """Test creating from an xyz file"""
         xyz_path = test_files['molecule_1']
@@ -195,6 +258,30 @@ class TestMoleculeObject:
         assert len(mol_obj.children) == 1
         assert mol_obj.children[0].name == f"{cube_path.stem}_field"
 
+    def test_from_xyz_files(self, test_files):
+        """Test loading several xyz files at once keeps the given order"""
+        paths = [test_files['molecule_1'], test_files['molecule_2']]
+
+        mol_objs = MoleculeObject.from_xyz_files(paths)
+        assert [mol_obj.name for mol_obj in mol_objs] == [
+            path.stem for path in paths]
+        assert all(len(mol_obj.molecule) > 0 for mol_obj in mol_objs)
+
+    def test_from_cube_files(self, test_files, tmp_path):
+        """Test loading several cube files at once keeps the given order"""
+        cube_path = test_files['scalar_filed_cube']
+        copy_path = tmp_path / 'zeta.cube'
+        shutil.copy(cube_path, copy_path)
+        paths = [copy_path, cube_path]
+
+        mol_objs = MoleculeObject.from_cube_files(paths)
+        assert [mol_obj.name for mol_obj in mol_objs] == [
+            path.stem for path in paths]
+        for mol_obj, path in zip(mol_objs, paths):
+            assert [child.name for child in mol_obj.children] == [
+                f"{path.stem}_field"]
+            assert isinstance(mol_obj.children[0], ScalarFieldObject)
+
 
 class TestTrajectoryObject:
     """Tests for TrajectoryObject class"""
@@ -256,6 +343,138 @@ class TestTrajectoryObject:
             assert child.name.startswith("Frame_")
             assert isinstance(child, MoleculeObject)
 
+    def test_set_active_frame(self, test_objects):
+        """Test that only the active frame is visible and rendered"""
+        traj_obj = TrajectoryObject.from_trajectory(
+            test_objects['trajectory'], "test_trajectory")
+        frames = traj_obj.children
+        assert traj_obj.active_frame == 0
+
+        assert traj_obj.set_active_frame(3) is True
+        assert traj_obj.active_frame == 3
+        assert [frame.visible for frame in frames] == [
+            i == 3 for i in range(len(frames))]
+
+        visible_frames = [node for node in traj_obj.iter_visible()
+                          if isinstance(node, MoleculeObject)]
+        assert visible_frames == [frames[3]]
+
+        assert traj_obj.set_active_frame(len(frames)) is False
+        assert traj_obj.active_frame == 3
+
+        # Hiding the trajectory hides the active frame as well
+        traj_obj.visible = False
+        assert list(traj_obj.iter_visible()) == []
+
+    def test_remove_children(self, test_objects):
+        """Test removing several frames and their images at once"""
+        traj_obj = TrajectoryObject.from_trajectory(
+            test_objects['trajectory'], "test_trajectory")
+        frames = traj_obj.children
+        n_frames = len(traj_obj.trajectory)
+
+        removed = traj_obj.remove_children(frames[1::2])
+        assert removed == frames[1::2]
+        assert traj_obj.children == frames[::2]
+        assert len(traj_obj.trajectory) == n_frames - len(removed)
+        assert [child.molecule for child in traj_obj.children] == list(
+            traj_obj.trajectory)
+        assert all(frame.parent is None for frame in removed)
+
+    def test_sparse_frames(self, test_objects):
+        """Test that a strided load creates the skipped frames on demand"""
+        trajectory = test_objects['trajectory']
+        n_frames = len(trajectory)
+        traj_obj = TrajectoryObject.from_trajectory(
+            trajectory, "test_trajectory", stride=2)
+
+        assert traj_obj.is_sparse
+        assert [child.name for child in traj_obj.children] == [
+            f"Frame_{i}" for i in range(0, n_frames, 2)]
+        sampled = traj_obj.children
+        assert f"[{len(sampled)} frames, 1/2]" in traj_obj.format_tree()
+        traj_obj.set_active_frame(1)
+
+        added = traj_obj.load_all_frames()
+        assert not traj_obj.is_sparse
+        assert len(added) == n_frames - len(sampled)
+        assert [child.molecule for child in traj_obj.children] == list(
+            trajectory)
+        assert traj_obj.children[::2] == sampled
+        assert traj_obj.active_frame == 2
+        assert traj_obj.load_all_frames() == []
+        assert f"[{n_frames} frames]" in traj_obj.format_tree()
+
+    def test_sparse_frame_on_demand(self, test_objects):
+        """Test that indexing a sparse trajectory creates only the asked frame"""
+        trajectory = test_objects['trajectory']
+        n_frames = len(trajectory)
+        traj_obj = TrajectoryObject.from_trajectory(
+            trajectory, "test_trajectory", stride=2)
+        sampled = traj_obj.children
+
+        assert traj_obj[2] is sampled[1]
+        frame = traj_obj[1]
+        assert frame.name == "Frame_1"
+        assert frame.molecule is trajectory[1]
+        assert traj_obj.children == [sampled[0], frame] + sampled[1:]
+        assert traj_obj[1] is frame
+        assert traj_obj.is_sparse
+
+        with pytest.raises(IndexError):
+            traj_obj[n_frames]
+
+        traj_obj.load_all_frames()
+        assert [child.molecule for child in traj_obj.children] == list(
+            trajectory)
+
+    def test_sparse_frame_edits(self, test_objects):
+        """Test that frames of a sparse trajectory map to the right images"""
+        trajectory = test_objects['trajectory']
+        n_frames = len(trajectory)
+        traj_obj = TrajectoryObject.from_trajectory(
+            trajectory, "test_trajectory", stride=2)
+        sampled = traj_obj.children
+
+        # Removing a frame removes its own image, not the one at its position
+        removed_molecule = sampled[1].molecule
+        traj_obj.remove_child(sampled[1])
+        assert len(trajectory) == n_frames - 1
+        assert all(molecule is not removed_molecule for molecule in trajectory)
+        traj_obj.remove_children([sampled[2]])
+        assert len(trajectory) == n_frames - 2
+        assert all(traj_obj[traj_obj._image_index(i)] is frame
+                   for i, frame in enumerate(traj_obj.children))
+
+        # Adding and reordering is refused, without creating skipped frames
+        n_children = len(traj_obj.children)
+        success, _ = traj_obj.add_child(
+            MoleculeObject("extra", test_objects['molecule_2']))
+        assert not success
+        success, _ = traj_obj.reorder_child(traj_obj.children[0], 1)
+        assert not success
+        assert len(traj_obj.children) == n_children
+        assert traj_obj.is_sparse
+
+    def test_remove_child_updates_trajectory(self, test_objects):
+        """Test that removing a frame removes the matching trajectory image"""
+        traj_obj = TrajectoryObject.from_trajectory(
+            test_objects['trajectory'], "test_trajectory")
+        frames = traj_obj.children
+        n_frames = len(traj_obj.trajectory)
+
+        removed = traj_obj.remove_child(frames[2])
+        assert removed is frames[2]
+        assert len(traj_obj.trajectory) == n_frames - 1
+        assert all(molecule is not frames[2].molecule
+                   for molecule in traj_obj.trajectory)
+
+        removed = traj_obj.clear()
+        assert len(removed) == n_frames - 1
+        assert len(traj_obj.children) == 0
+        assert len(traj_obj.trajectory) == 0
+        assert all(frame.parent is None for frame in removed)
+
 
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__])
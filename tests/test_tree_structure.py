@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from PyQt5.QtCore import QObject
 from chemvista.tree_structure import TreeNode, NodePath, TreeSignals
@@ -11,20 +13,25 @@ class TestNodePath:
         # Create empty path
         path = NodePath()
         assert str(path) == "/"
-        assert path.parts == []
+        assert path.parts == ()
 
         # Create path with parts
         path = NodePath(["root", "level1", "level2"])
         assert str(path) == "/root/level1/level2"
-        assert path.parts == ["root", "level1", "level2"]
+        assert path.parts == ("root", "level1", "level2")
 
         # Create from string
         path = NodePath.from_string("/root/level1/level2")
-        assert path.parts == ["root", "level1", "level2"]
+        assert path.parts == ("root", "level1", "level2")
 
         # Handle trailing slashes
         path = NodePath.from_string("/root/level1/level2/")
-        assert path.parts == ["root", "level1", "level2"]
+        assert path.parts == ("root", "level1", "level2")
+
+        # Empty segments are ignored
+        assert NodePath.from_string("/").parts == ()
+        assert NodePath.from_string("/root//level1").parts == (
+            "root", "level1")
 
     def test_node_path_operations(self):
         """Test node path operations"""
@@ -40,7 +47,7 @@ class TestNodePath:
 
         # Test root parent
         root_path = NodePath(["root"])
-        assert root_path.parent().parts == []
+        assert root_path.parent().parts == ()
 
         # Test empty path parent
         empty_path = NodePath()
@@ -50,6 +57,19 @@ class TestNodePath:
         assert path.name == "level1"
         assert empty_path.name == ""
 
+        # Paths are hashable and compare by their parts
+        index = {path: "level1"}
+        assert index[NodePath.from_string("/root/level1")] == "level1"
+        assert hash(path) == hash(NodePath(["root", "level1"]))
+
+        # Parts given as a list are copied, so editing the list afterwards
+        # cannot change the cached string or hash
+        parts = ["root", "level1"]
+        path = NodePath(parts)
+        parts.append("level2")
+        assert path.parts == ("root", "level1")
+        assert str(path) == "/root/level1"
+
 
 class TestTreeNode:
     """Tests for TreeNode class"""
@@ -69,6 +89,13 @@ class TestTreeNode:
         # Test path for root
         assert str(root.path) == "/root"
 
+    def test_uuids_unique(self):
+        """Test that pooled uuids are distinct valid UUID4 strings"""
+        nodes = [TreeNode(f"node{i}") for i in range(5000)]
+        uuids = {node.uuid for node in nodes}
+        assert len(uuids) == len(nodes)
+        assert all(uuid.UUID(value).version == 4 for value in uuids)
+
     def test_parent_child_relationship(self):
         """Test setting up parent-child relationships"""
         root = TreeNode("root")
@@ -139,6 +166,7 @@ class TestTreeNode:
         assert success is True
         assert root.children[0] == child2
         assert root.children[1] == child1
+        assert list(root.iter_children()) == [child2, child1]
 
         # Invalid position
         child3 = TreeNode("child3")
@@ -161,15 +189,93 @@ class TestTreeNode:
         assert child1.parent is None
 
         # Remove by UUID
-        removed = root.remove_child(child2.uuid)
+        removed = root.remove_child_by_uuid(child2.uuid)
         assert removed == child2
         assert child2 not in root.children
         assert child2.parent is None
 
         # Remove non-existent child
-        removed = root.remove_child("non-existent-uuid")
+        removed = root.remove_child_by_uuid("non-existent-uuid")
         assert removed is None
 
+    def test_child_name_tracking(self):
+        """Test that child names are tracked through add, rename and remove"""
+        root = TreeNode("root")
+        child1 = TreeNode("child")
+        child2 = TreeNode("child")
+        root.add_child(child1)
+        root.add_child(child2, position=0)
+        assert root.has_child_named("child")
+        # The first sibling in child order wins on duplicate names
+        assert root.get_child_by_name("child") is child2
+
+        root.remove_child(child1)
+        assert root.has_child_named("child")
+        assert root.get_child_by_name("child") is child2
+
+        child2.name = "renamed"
+        assert not root.has_child_named("child")
+        assert root.has_child_named("renamed")
+        assert root.get_child_by_name("child") is None
+        assert root.get_by_path("/root/renamed") is child2
+
+        root.remove_child(child2)
+        assert not root.has_child_named("renamed")
+
+    def test_index_of_follows_reorder(self):
+        """Test that child positions stay correct through reorder and removal"""
+        root = TreeNode("root")
+        children = [TreeNode(f"child{i}") for i in range(4)]
+        for child in children:
+            root.add_child(child)
+        assert [root.index_of(child) for child in children] == [0, 1, 2, 3]
+
+        success, _ = root.reorder_child(children[3], 1)
+        assert success is True
+        assert root.index_of(children[3]) == 1
+        assert root.index_of(children[1]) == 2
+
+        root.remove_child(children[0])
+        assert root.index_of(children[3]) == 0
+        with pytest.raises(KeyError):
+            root.index_of(children[0])
+
+    def test_reorder_child_positions(self):
+        """Test reordering to the first position, a no-op and out of range"""
+        root = TreeNode("root")
+        children = [TreeNode(f"child{i}") for i in range(3)]
+        for child in children:
+            root.add_child(child)
+
+        success, _ = root.reorder_child(children[2], 0)
+        assert success is True
+        assert root.children == [children[2], children[0], children[1]]
+
+        success, msg = root.reorder_child(children[2], 0)
+        assert success is True
+        assert "already" in msg
+
+        success, _ = root.reorder_child(children[0], 3)
+        assert success is False
+        assert root.children == [children[2], children[0], children[1]]
+
+    def test_cycles_rejected(self):
+        """Test that a node cannot be attached below itself"""
+        root = TreeNode("root")
+        child = TreeNode("child")
+        grandchild = TreeNode("grandchild")
+        root.add_child(child)
+        child.add_child(grandchild)
+
+        success, _ = grandchild.add_child(root)
+        assert success is False
+        success, _ = root.move(child, grandchild)
+        assert success is False
+        assert grandchild.parent is child
+        with pytest.raises(ValueError):
+            child.parent = grandchild
+        assert child.parent is root
+
     def test_path_invalidation(self):
         """Test path cache invalidation"""
         root = TreeNode("root")
@@ -184,10 +290,17 @@ class TestTreeNode:
 
         # Change name and verify path updates
         level1.name = "renamed"
-        level1._invalidate_path_cache()
         assert str(level1.path) == "/root/renamed"
         assert str(level2.path) == "/root/renamed/level2"
 
+        # Removed nodes lose their old path, moved ones pick up the new one
+        root.remove_child(level1)
+        assert str(level2.path) == "/renamed/level2"
+        other = TreeNode("other")
+        root.add_child(other)
+        other.add_child(level1)
+        assert str(level2.path) == "/root/other/renamed/level2"
+
     def test_node_type_filtering(self):
         """Test creating a subclass with type filtering"""
 
@@ -284,6 +397,112 @@ class TestTreeSignals:
         assert signal_emitted, "Node removed signal was not emitted"
         assert uuid_received == child_uuid, "Signal emitted with wrong UUID"
 
+    def test_subtree_visibility_emits_once(self, signals, qtbot):
+        """Test that hiding a subtree is reported with one signal of each kind"""
+        root = TreeNode("root", signals=signals)
+        child = TreeNode("child", signals=signals)
+        grandchild = TreeNode("grandchild", signals=signals)
+        root.add_child(child)
+        child.add_child(grandchild)
+
+        single, bulk, structure = [], [], []
+        signals.visibility_changed.connect(
+            lambda uuid, visible: single.append(uuid))
+        signals.visibilities_changed.connect(lambda pairs: bulk.append(pairs))
+        signals.tree_structure_changed.connect(lambda: structure.append(True))
+
+        assert child.set_subtree_visibility(False) == [child, grandchild]
+        assert not child.visible and not grandchild.visible
+        assert single == []
+        assert bulk == [[(child.uuid, False), (grandchild.uuid, False)]]
+        assert len(structure) == 1
+
+        assert child.set_subtree_visibility(False) == []
+        assert len(bulk) == 1
+
+    def test_move_emits_once(self, signals, qtbot):
+        """Test that a move is reported as one addition and one structure change"""
+        root = TreeNode("root", signals=signals)
+        source = TreeNode("source", signals=signals)
+        target = TreeNode("target", signals=signals)
+        child = TreeNode("child", signals=signals)
+        root.add_child(source)
+        root.add_child(target)
+        source.add_child(child)
+
+        events = []
+        signals.node_added.connect(lambda uuid: events.append(("added", uuid)))
+        signals.node_removed.connect(
+            lambda uuid: events.append(("removed", uuid)))
+        signals.tree_structure_changed.connect(
+            lambda: events.append(("structure",)))
+
+        success, _ = root.move(child, target)
+        assert success
+        assert events == [("added", child.uuid), ("structure",)]
+
+    def test_attached_subtree_announced(self, signals, qtbot):
+        """Test that nodes built below a child are announced when it is attached"""
+        root = TreeNode("root", signals=signals)
+        other = TreeNode("other", signals=signals)
+        root.add_child(other)
+        folder = TreeNode("folder", signals=signals)
+        inner = TreeNode("inner", signals=signals)
+        folder.add_child(inner)
+
+        events = []
+        signals.node_added.connect(lambda uuid: events.append(("added", uuid)))
+        signals.nodes_added.connect(lambda uuids: events.append(
+            ("bulk", [root.get_object_by_uuid(uuid) for uuid in uuids])))
+        signals.tree_structure_changed.connect(
+            lambda: events.append(("structure",)))
+
+        root.add_child(folder)
+        assert events == [("added", folder.uuid), ("bulk", [inner]), ("structure",)]
+
+        # Moving the subtree does not announce its descendants again
+        events.clear()
+        root.move(folder, other)
+        assert events == [("added", folder.uuid), ("structure",)]
+
+    def test_batch_covers_whole_tree(self, signals, qtbot):
+        """Test that a batch on the root also holds back changes deeper in the tree"""
+        root = TreeNode("root", signals=signals)
+        folder = TreeNode("folder", signals=signals)
+        first = TreeNode("first", signals=signals)
+        second = TreeNode("second", signals=signals)
+        root.add_child(folder)
+        folder.add_child(first)
+
+        events = []
+        signals.node_added.connect(lambda uuid: events.append(("added", uuid)))
+        signals.nodes_added.connect(lambda uuids: events.append(("bulk", uuids)))
+        signals.tree_structure_changed.connect(
+            lambda: events.append(("structure",)))
+
+        with root.batch_structure_changes():
+            folder.add_child(second)
+            folder.reorder_child(second, 0)
+            assert events == []
+
+        assert events == [("bulk", [second.uuid]), ("structure",)]
+
+    def test_move_invalid_position_keeps_node(self, signals, qtbot):
+        """Test that a move to an invalid position leaves the node in place"""
+        root = TreeNode("root", signals=signals)
+        source = TreeNode("source", signals=signals)
+        target = TreeNode("target", signals=signals)
+        child = TreeNode("child", signals=signals)
+        root.add_child(source)
+        root.add_child(target)
+        source.add_child(child)
+
+        success, _ = root.move(child, target, position=5)
+        assert not success
+        assert child.parent is source
+        assert source.children == [child]
+        assert target.children == []
+
 
 class TestTreeTraversal:
     """Tests for tree traversal functions"""
@@ -378,6 +597,12 @@ class TestTreeTraversal:
         assert NodePath.from_string(
             "/root/folderA/nonexistent") not in sample_tree
 
+        # A node that only names a parent it was never added to is not in the tree
+        detached = TreeNode("detached", parent=folderA)
+        assert detached not in sample_tree
+        assert detached not in folderA
+        assert detached.uuid not in sample_tree
+
     def test_get_object_by_uuid(self, sample_tree):
         """Test the get_object_by_uuid method"""
         # Get UUID of a nested node
@@ -404,6 +629,112 @@ class TestTreeTraversal:
         # Test with non-existent UUID
         assert sample_tree.get_object_by_uuid("nonexistent-uuid") is None
 
+    def test_uuid_lookup_follows_changes(self, sample_tree):
+        """Test that uuid lookups stay correct as subtrees move around"""
+        folder = sample_tree.get_object_by_name("folderA")
+        # Build the index before changing the tree
+        assert sample_tree.get_object_by_uuid(folder.uuid) is folder
+
+        branch = TreeNode("branch")
+        leaf = TreeNode("leaf")
+        branch.add_child(leaf)
+        assert branch.get_object_by_uuid(leaf.uuid) is leaf
+        folder.add_child(branch)
+        assert sample_tree.get_object_by_uuid(leaf.uuid) is leaf
+        assert folder.get_object_by_uuid(leaf.uuid) is leaf
+        assert branch.get_object_by_uuid(folder.uuid) is None
+
+        folder.remove_child(branch)
+        assert sample_tree.get_object_by_uuid(leaf.uuid) is None
+        assert leaf.uuid not in sample_tree
+        assert branch.get_object_by_uuid(leaf.uuid) is leaf
+
+        sample_tree.add_child(branch)
+        sample_tree.move(branch, folder)
+        assert folder.get_object_by_uuid(leaf.uuid) is leaf
+        assert leaf in folder
+
+    def test_name_lookup_follows_changes(self, sample_tree):
+        """Test that name lookups stay correct through renames and removals"""
+        folder = sample_tree.get_object_by_name("folderA")
+        leaf = TreeNode("leaf")
+        folder.add_child(leaf)
+        assert sample_tree.get_object_by_name("leaf") is leaf
+
+        leaf.name = "renamed"
+        assert sample_tree.get_object_by_name("leaf") is None
+        assert sample_tree.get_object_by_name("renamed") is leaf
+
+        other = TreeNode("renamed")
+        sample_tree.add_child(other)
+        # The node found first in pre-order wins
+        assert sample_tree.get_object_by_name("renamed") is leaf
+        assert other.get_object_by_name("renamed") is other
+
+        folder.remove_child(leaf)
+        assert sample_tree.get_object_by_name("renamed") is other
+        assert folder.get_object_by_name("renamed") is None
+
+    def test_subtree_size(self, sample_tree):
+        """Test that subtree sizes follow additions, removals and moves"""
+        assert sample_tree.subtree_size == len(list(sample_tree.iter_nodes()))
+        folder = sample_tree.get_object_by_name("folderA")
+        folder_size = folder.subtree_size
+        total = sample_tree.subtree_size
+
+        branch = TreeNode("branch")
+        branch.add_child(TreeNode("leaf"))
+        folder.add_child(branch)
+        assert folder.subtree_size == folder_size + 2
+        assert sample_tree.subtree_size == total + 2
+
+        sample_tree.move(branch, sample_tree)
+        assert folder.subtree_size == folder_size
+        assert sample_tree.subtree_size == total + 2
+
+        sample_tree.remove_child(branch)
+        assert sample_tree.subtree_size == total
+        assert branch.subtree_size == 2
+
+    def test_find_by_name_and_type(self, sample_tree):
+        """Test name and type lookups follow pre-order"""
+        assert sample_tree.get_object_by_name("root") is sample_tree
+        assert sample_tree.get_object_by_name("nestedFile1").path == NodePath.from_string(
+            "/root/folderA/nested/nestedFile1")
+        assert sample_tree.get_object_by_name("missing") is None
+
+        files = sample_tree.find_objects_by_type("file")
+        assert [node.name for node in files] == [
+            "fileA1", "fileA2", "nestedFile1", "fileB1"]
+        assert [node.name for node in sample_tree.iter_nodes()] == [
+            node.name for _, node in sample_tree.iter_tree()]
+
+    def test_type_index_follows_changes(self, sample_tree):
+        """Test that type lookups see added, moved and removed nodes"""
+        folderA = sample_tree.get_object_by_name("folderA")
+        folderB = sample_tree.get_object_by_name("folderB")
+        assert [node.name for node in folderB.find_objects_by_type("file")] == [
+            "fileB1"]
+
+        late = TreeNode("late", node_type="file")
+        folderA.add_child(late, position=0)
+        sample_tree.move(folderA.get_child_by_name("fileA2"), folderB)
+        sample_tree.remove_child(folderB)
+
+        assert [node.name for node in sample_tree.find_objects_by_type("file")] == [
+            "late", "fileA1", "nestedFile1"]
+        assert sample_tree.find_objects_by_type("missing") == []
+
+    def test_type_lookup_below_unattached_parent(self, sample_tree):
+        """Test type lookups in a subtree whose parent was never attached"""
+        top = TreeNode("top", parent=sample_tree)
+        top.add_child(TreeNode("c", node_type="foo"))
+        d = TreeNode("d")
+        top.add_child(d)
+
+        assert d.find_objects_by_type("foo") == []
+        assert [node.name for node in top.find_objects_by_type("foo")] == ["c"]
+
     def test_collect_visible_nodes(self, sample_tree):
         """Test collecting only visible nodes"""
         # Make some nodes invisible